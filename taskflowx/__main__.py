@@ -14,12 +14,16 @@
 
 
 # Imports
+import os
+import time
 import click
 from rich.console import Console
 from rich.traceback import install
 from taskflowx.config import Config
 from taskflowx.logger import logger
 from taskflowx.runner import run
+from taskflowx.control import send_command, DEFAULT_SOCKET
+from taskflowx.profiling import PROFILE_MODES, DEFAULT_PROFILE_MODE
 
 
 # Backtrack with Rick
@@ -28,11 +32,13 @@ install()
 
 
 # Main command
-@click.command()
-@click.option("--config", help="Path to the configuration file.", required=True)
+@click.group(invoke_without_command=True)
+@click.option("--config", help="Path to the configuration file.")
 @click.option("--triggers", help="Directory containing trigger modules.")
-@click.option("--workflows", help="Directory containing workflow modules.", required=True)
+@click.option("--workflows", help="Directory containing workflow modules.")
+@click.pass_context
 def main(
+        ctx,
         config: str,
         triggers: str,
         workflows: str
@@ -45,6 +51,16 @@ def main(
         triggers (str): Directory containing trigger modules.
         workflows (str): Directory containing workflow modules.
     """
+    # A subcommand talks to a running instance
+    if ctx.invoked_subcommand is not None:
+        return
+    # end if
+
+    # Check required options
+    if not config or not workflows:
+        raise click.UsageError("Options '--config' and '--workflows' are required.")
+    # end if
+
     try:
         config_instance = Config(config)
         run(
@@ -62,6 +78,105 @@ def main(
 # end main
 
 
+# Profile command
+@main.command()
+@click.option("--workflow", help="Name of the workflow to profile.", required=True)
+@click.option("--seconds", help="Profiling duration in seconds.", type=float, default=30, show_default=True)
+@click.option("--mode", help="Profiler to attach.", type=click.Choice(list(PROFILE_MODES)), default=DEFAULT_PROFILE_MODE, show_default=True)
+@click.option("--output", help="Output file (pstats or collapsed stacks).")
+@click.option("--socket", "socket_path", help="Control socket of the running instance.", default=DEFAULT_SOCKET, show_default=True)
+def profile(
+        workflow: str,
+        seconds: float,
+        mode: str,
+        output: str,
+        socket_path: str
+):
+    """
+    Profile the handler executions of a workflow in a running instance.
+
+    Args:
+        workflow (str): Name of the workflow to profile.
+        seconds (float): Profiling duration in seconds.
+        mode (str): Profiler to attach, 'cprofile' or 'sample'.
+        output (str): Output file.
+        socket_path (str): Control socket of the running instance.
+    """
+    # Default output file
+    if output is None:
+        output = f"{workflow}-{time.strftime('%Y%m%d-%H%M%S')}.{PROFILE_MODES[mode].extension}"
+    # end if
+
+    try:
+        result = send_command(
+            socket_path,
+            "profile",
+            timeout=seconds + 30,
+            workflow=workflow,
+            seconds=seconds,
+            mode=mode,
+            output=os.path.abspath(output)
+        )
+        if result["output"] is None:
+            console.print(f"No executions were profiled ({result['calls']} execution(s) of '{workflow}')")
+        else:
+            console.print(f"Profiled {result['calls']} execution(s) of '{workflow}', written to {result['output']}")
+        # end if
+    except (OSError, RuntimeError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}", style="bold red")
+        raise SystemExit(1)
+    # end try
+# end profile
+
+
+# Lanes command
+@main.command()
+@click.option("--socket", "socket_path", help="Control socket of the running instance.", default=DEFAULT_SOCKET, show_default=True)
+def lanes(
+        socket_path: str
+):
+    """
+    Show the state of the priority lanes of a running instance.
+
+    Args:
+        socket_path (str): Control socket of the running instance.
+    """
+    try:
+        result = send_command(socket_path, "lanes", timeout=10)
+    except (OSError, RuntimeError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}", style="bold red")
+        raise SystemExit(1)
+    # end try
+    for name, stats in result["lanes"].items():
+        console.print(f"[bold]{name}[/bold] " + " ".join(f"{k}={v}" for k, v in stats.items()))
+    # end for
+# end lanes
+
+
+# Resources command
+@main.command()
+@click.option("--socket", "socket_path", help="Control socket of the running instance.", default=DEFAULT_SOCKET, show_default=True)
+def resources(
+        socket_path: str
+):
+    """
+    Show the metrics of the shared resources of a running instance (e.g. email send latency).
+
+    Args:
+        socket_path (str): Control socket of the running instance.
+    """
+    try:
+        result = send_command(socket_path, "resources", timeout=10)
+    except (OSError, RuntimeError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}", style="bold red")
+        raise SystemExit(1)
+    # end try
+    for name, stats in result["resources"].items():
+        console.print(f"[bold]{name}[/bold] " + " ".join(f"{k}={v}" for k, v in stats.items()))
+    # end for
+# end resources
+
+
 if __name__ == "__main__":
     main()
 # end if
@@ -0,0 +1,20 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+
+# Imports
+from .email import EmailAction
+
+# Export
+__all__ = ["EmailAction"]
@@ -0,0 +1,584 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import re
+import copy
+import time
+import queue
+import smtplib
+import threading
+import email.policy
+from collections import deque
+from concurrent.futures import Future
+from email.message import EmailMessage
+from email.utils import getaddresses
+from taskflowx.logger import logger
+from taskflowx.resources import create_smtp
+
+
+# Number of latencies kept for the percentiles
+LATENCY_WINDOW = 1024
+
+
+# Outgoing message
+class OutgoingMessage:
+    """
+    Message waiting in the send queue.
+    """
+
+    def __init__(
+            self,
+            from_addr: str,
+            to_addrs: list,
+            data: bytes
+    ):
+        """
+        Constructor.
+
+        Args:
+        - from_addr: The envelope sender.
+        - to_addrs: The envelope recipients.
+        - data: The message, CRLF terminated lines.
+        """
+        self.from_addr = from_addr
+        self.to_addrs = to_addrs
+        self.data = data
+        self.future = Future()
+        self.attempts = 0
+        self.queued_at = time.monotonic()
+    # end __init__
+
+# end OutgoingMessage
+
+
+# Send messages with pipelining
+def pipeline_send(conn, messages, results):
+    """
+    Send messages over one SMTP session with command pipelining (RFC 2920).
+
+    The envelope of a message (MAIL, RCPT, DATA) is sent in one write, together with the content of the
+    previous message, so each message costs about one round trip.
+
+    Args:
+    - conn: A connected smtplib.SMTP object whose server supports PIPELINING.
+    - messages: The OutgoingMessage objects to send.
+    - results: The list receiving, for each message, the refused recipients or an SMTPException.
+    """
+    # Content (or RSET) sent with the next envelope, and the replies it expects
+    carry = b""
+    carry_replies = []
+    refused = {}
+
+    # Read the replies of the previous write
+    def read_carry():
+        for index in carry_replies:
+            code, resp = conn.getreply()
+            if index is None:
+                continue
+            # end if
+            if code == 250:
+                results[index] = refused.pop(index)
+            else:
+                results[index] = smtplib.SMTPDataError(code, resp)
+            # end if
+        # end for
+    # end read_carry
+
+    for index, message in enumerate(messages):
+        # Envelope
+        envelope = f"MAIL FROM:<{message.from_addr}>\r\n".encode()
+        for to_addr in message.to_addrs:
+            envelope += f"RCPT TO:<{to_addr}>\r\n".encode()
+        # end for
+        envelope += b"DATA\r\n"
+        conn.send(carry + envelope)
+        read_carry()
+        carry, carry_replies = b"", []
+
+        # Envelope replies
+        mail_code, mail_resp = conn.getreply()
+        message_refused = {}
+        for to_addr in message.to_addrs:
+            code, resp = conn.getreply()
+            if code not in (250, 251):
+                message_refused[to_addr] = (code, resp)
+            # end if
+        # end for
+        data_code, data_resp = conn.getreply()
+
+        # Accepted, the content goes with the next envelope
+        if mail_code == 250 and len(message_refused) < len(message.to_addrs) and data_code == 354:
+            refused[index] = message_refused
+            carry = re.sub(rb"(?m)^\.", b"..", message.data)
+            if not carry.endswith(b"\r\n"):
+                carry += b"\r\n"
+            # end if
+            carry += b".\r\n"
+            carry_replies = [index]
+            continue
+        # end if
+
+        # Rejected, end the transaction
+        if data_code == 354:
+            carry, carry_replies = b".\r\nRSET\r\n", [None, None]
+        else:
+            carry, carry_replies = b"RSET\r\n", [None]
+        # end if
+        if mail_code != 250:
+            results[index] = smtplib.SMTPSenderRefused(mail_code, mail_resp, message.from_addr)
+        elif len(message_refused) == len(message.to_addrs):
+            results[index] = smtplib.SMTPRecipientsRefused(message_refused)
+        else:
+            results[index] = smtplib.SMTPDataError(data_code, data_resp)
+        # end if
+    # end for
+
+    # Last content
+    if carry:
+        conn.send(carry)
+        read_carry()
+    # end if
+# end pipeline_send
+
+
+# Email action
+class EmailAction:
+    """
+    Send emails through a pool of persistent, authenticated SMTP sessions.
+
+    Messages are queued and sent in batches by one thread per connection, with command pipelining when
+    the server supports it. Temporary failures (4xx codes, lost connections) are retried with an
+    exponential delay.
+    """
+
+    def __init__(
+            self,
+            host: str,
+            port: int = 0,
+            username: str = None,
+            password: str = None,
+            ssl: bool = False,
+            starttls: bool = False,
+            from_addr: str = None,
+            connections: int = 2,
+            batch_size: int = 50,
+            queue_size: int = 10000,
+            max_retries: int = 3,
+            retry_delay: float = 1.0,
+            connect_timeout: float = 30,
+            check_after: float = 30
+    ):
+        """
+        Constructor.
+
+        Args:
+        - host: The SMTP server.
+        - port: The SMTP port, the default port of the protocol if 0.
+        - username: The login.
+        - password: The password.
+        - ssl: Whether to connect with implicit TLS.
+        - starttls: Whether to upgrade the connections with STARTTLS.
+        - from_addr: The default sender, the login by default.
+        - connections: The number of SMTP sessions (and sending threads).
+        - batch_size: The maximum number of messages sent in a row on a session.
+        - queue_size: The maximum number of queued messages, send() blocks when full.
+        - max_retries: The number of retries of temporary failures.
+        - retry_delay: The delay before the first retry, doubled at each attempt.
+        - connect_timeout: The socket timeout in seconds.
+        - check_after: The idle time in seconds after which a session is checked (NOOP) before reuse.
+        """
+        self.pool = create_smtp(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            ssl=ssl,
+            starttls=starttls,
+            connect_timeout=connect_timeout,
+            max_size=connections,
+            check_after=check_after
+        )
+        self.from_addr = from_addr or username
+        self.connections = connections
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._unresolved = 0
+        self._retries = {}
+        self._closing = False
+        self._threads = []
+    # end __init__
+
+    # Start the sending threads
+    def _start(self):
+        """
+        Start the sending threads on first use.
+        """
+        with self._lock:
+            if self._threads:
+                return
+            # end if
+            for i in range(self.connections):
+                thread = threading.Thread(target=self._run, name=f"taskflowx-smtp-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            # end for
+        # end with
+    # end _start
+
+    # Send an email
+    def send(
+            self,
+            to,
+            subject: str,
+            body: str,
+            from_addr: str = None,
+            cc=None,
+            bcc=None,
+            html: str = None,
+            headers: dict = None
+    ):
+        """
+        Queue an email.
+
+        Args:
+        - to: The recipient or list of recipients.
+        - subject: The subject.
+        - body: The plain text body.
+        - from_addr: The sender, the default sender if None.
+        - cc: The carbon copy recipients.
+        - bcc: The blind carbon copy recipients.
+        - html: An HTML alternative of the body.
+        - headers: Additional headers.
+
+        Returns:
+        - A Future resolved with the refused recipients once the server accepted the message.
+        """
+        def addresses(value):
+            return [value] if isinstance(value, str) else list(value or [])
+        # end addresses
+
+        msg = EmailMessage()
+        msg["From"] = from_addr or self.from_addr
+        msg["To"] = ", ".join(addresses(to))
+        if cc:
+            msg["Cc"] = ", ".join(addresses(cc))
+        # end if
+        if bcc:
+            msg["Bcc"] = ", ".join(addresses(bcc))
+        # end if
+        msg["Subject"] = subject
+        for name, value in (headers or {}).items():
+            msg[name] = value
+        # end for
+        msg.set_content(body)
+        if html is not None:
+            msg.add_alternative(html, subtype="html")
+        # end if
+
+        return self.send_message(msg)
+    # end send
+
+    # Send a message
+    def send_message(self, msg):
+        """
+        Queue an email message.
+
+        Args:
+        - msg: The email.message.Message to send.
+
+        Returns:
+        - A Future resolved with the refused recipients once the server accepted the message.
+        """
+        # Envelope
+        from_addr = getaddresses([msg["Sender"] or msg["From"] or self.from_addr or ""])[0][1]
+        to_addrs = [
+            addr for _, addr in getaddresses(msg.get_all("To", []) + msg.get_all("Cc", []) + msg.get_all("Bcc", []))
+            if addr
+        ]
+        if not to_addrs:
+            raise ValueError("The message has no recipient")
+        # end if
+
+        # Bcc recipients are not sent in the headers
+        if "Bcc" in msg:
+            msg = copy.copy(msg)
+            del msg["Bcc"]
+        # end if
+
+        outgoing = OutgoingMessage(from_addr, to_addrs, msg.as_bytes(policy=email.policy.SMTP))
+        self._start()
+        with self._lock:
+            self._unresolved += 1
+        # end with
+        self.queue.put(outgoing)
+        return outgoing.future
+    # end send_message
+
+    # Sending loop
+    def _run(self):
+        """
+        Take batches of messages from the queue and send them.
+        """
+        while True:
+            message = self.queue.get()
+            if message is None:
+                self.queue.task_done()
+                return
+            # end if
+
+            # Batch the queued messages
+            batch = [message]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    message = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                # end try
+                if message is None:
+                    stop = True
+                    self.queue.task_done()
+                    break
+                # end if
+                batch.append(message)
+            # end while
+
+            try:
+                self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+                # end for
+            # end try
+
+            if stop:
+                return
+            # end if
+        # end while
+    # end _run
+
+    # Send a batch
+    def _send_batch(self, batch):
+        """
+        Send a batch of messages on a pooled session.
+
+        Args:
+        - batch: The OutgoingMessage objects to send.
+        """
+        results = [None] * len(batch)
+        error = None
+        try:
+            with self.pool.connection() as conn:
+                if conn.has_extn("pipelining"):
+                    pipeline_send(conn, batch, results)
+                else:
+                    for index, message in enumerate(batch):
+                        try:
+                            results[index] = conn.sendmail(message.from_addr, message.to_addrs, message.data)
+                        except smtplib.SMTPResponseException as e:
+                            results[index] = e
+                            conn.rset()
+                        except smtplib.SMTPRecipientsRefused as e:
+                            results[index] = e
+                        # end try
+                    # end for
+                # end if
+            # end with
+        except (smtplib.SMTPException, OSError) as e:
+            # Lost session, messages without result are retried
+            error = e
+        # end try
+
+        # Resolve the futures
+        now = time.monotonic()
+        for message, result in zip(batch, results):
+            if result is None:
+                result = error or smtplib.SMTPServerDisconnected("No reply from server")
+            # end if
+            if not isinstance(result, Exception):
+                with self._lock:
+                    self.sent += 1
+                    self._latencies.append(now - message.queued_at)
+                # end with
+                self._resolve(message, result=result)
+            elif self._temporary(result) and message.attempts < self.max_retries and not self._closing:
+                self._retry(message, result)
+            else:
+                self._resolve(message, error=result)
+            # end if
+        # end for
+    # end _send_batch
+
+    # Resolve a message
+    def _resolve(self, message, result=None, error=None):
+        """
+        Resolve the future of a message and wake up flush() when no message is left.
+
+        Args:
+        - message: The OutgoingMessage.
+        - result: The refused recipients of a sent message.
+        - error: The failure of a message which cannot be sent.
+        """
+        if error is not None:
+            with self._lock:
+                self.failed += 1
+            # end with
+            logger.error(f"EmailAction: cannot send to {message.to_addrs}: {error}")
+            message.future.set_exception(error)
+        else:
+            message.future.set_result(result)
+        # end if
+        with self._done:
+            self._unresolved -= 1
+            self._done.notify_all()
+        # end with
+    # end _resolve
+
+    # Temporary failure
+    @staticmethod
+    def _temporary(error):
+        """
+        Check if a failure may succeed later.
+
+        Args:
+        - error: The exception.
+        """
+        if isinstance(error, smtplib.SMTPResponseException):
+            return 400 <= error.smtp_code < 500
+        elif isinstance(error, smtplib.SMTPRecipientsRefused):
+            return all(400 <= code < 500 for code, _ in error.recipients.values())
+        # end if
+        return isinstance(error, (smtplib.SMTPServerDisconnected, OSError))
+    # end _temporary
+
+    # Retry a message
+    def _retry(self, message, error):
+        """
+        Queue a message again after an exponential delay.
+
+        Args:
+        - message: The OutgoingMessage.
+        - error: The failure.
+        """
+        delay = self.retry_delay * 2 ** message.attempts
+        message.attempts += 1
+        with self._lock:
+            self.retried += 1
+        # end with
+        logger.warning(f"EmailAction: retrying message to {message.to_addrs} in {delay}s ({error})")
+        timer = threading.Timer(delay, self._requeue, args=(message,))
+        timer.daemon = True
+        with self._lock:
+            self._retries[message] = timer
+        # end with
+        timer.start()
+    # end _retry
+
+    # Queue a retried message
+    def _requeue(self, message):
+        """
+        Queue a message whose retry delay has elapsed, unless close() gave up on it.
+
+        Args:
+        - message: The OutgoingMessage.
+        """
+        with self._lock:
+            if self._retries.pop(message, None) is None:
+                return
+            # end if
+        # end with
+        self.queue.put(message)
+    # end _requeue
+
+    # Wait for the messages
+    def flush(self, timeout: float = None):
+        """
+        Wait until every message, waiting retries included, has been sent or has failed.
+
+        Args:
+        - timeout: The maximum time to wait in seconds, None to wait until done.
+
+        Returns:
+        - True if every message was resolved, False on timeout.
+        """
+        with self._done:
+            return self._done.wait_for(lambda: self._unresolved == 0, timeout)
+        # end with
+    # end flush
+
+    # Statistics
+    def stats(self):
+        """
+        Get the send counters and the latency percentiles (queueing included) in milliseconds.
+
+        Returns:
+        - A dictionary of metrics.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "sent": self.sent,
+                "failed": self.failed,
+                "retried": self.retried,
+                "queued": self.queue.qsize(),
+                "retrying": len(self._retries)
+            }
+        # end with
+        for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            stats[f"latency_{name}_ms"] = round(latencies[int(q * (len(latencies) - 1))] * 1000, 2) if latencies else None
+        # end for
+        return stats
+    # end stats
+
+    # Close
+    def close(self, timeout: float = None):
+        """
+        Send the queued messages and their retries, stop the threads and close the sessions.
+
+        Args:
+        - timeout: The maximum time to wait for the messages in seconds, None to wait until done. Retries
+          still waiting for their delay afterwards fail.
+        """
+        if not self.flush(timeout):
+            with self._lock:
+                self._closing = True
+                retries = self._retries
+                self._retries = {}
+            # end with
+            for message, timer in retries.items():
+                timer.cancel()
+                self._resolve(message, error=smtplib.SMTPServerDisconnected("EmailAction closed before the retry"))
+            # end for
+        # end if
+        for _ in self._threads:
+            self.queue.put(None)
+        # end for
+        for thread in self._threads:
+            thread.join()
+        # end for
+        self._threads = []
+        self.pool.close()
+    # end close
+
+# end EmailAction
+
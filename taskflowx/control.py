@@ -0,0 +1,184 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import os
+import json
+import socket
+import socketserver
+from .logger import logger
+from .profiling import profile_workflow, DEFAULT_PROFILE_MODE
+
+
+# Default control socket
+DEFAULT_SOCKET = "/tmp/taskflowx.sock"
+
+
+# Control request handler
+class ControlHandler(socketserver.StreamRequestHandler):
+    """
+    Handle one JSON command per connection and answer with one JSON line.
+    """
+
+    def handle(self):
+        """
+        Handle a control command.
+        """
+        # Connection closed without a command, e.g. a liveness probe
+        line = self.rfile.readline()
+        if not line.strip():
+            return
+        # end if
+        try:
+            message = json.loads(line)
+            command = message.pop("command", None)
+            response = self.server.dispatch(command, **message)
+            response["status"] = "ok"
+        except Exception as e:
+            logger.error(f"Control command failed: {e}")
+            response = {"status": "error", "message": str(e)}
+        # end try
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+    # end handle
+
+# end ControlHandler
+
+
+# Control server
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Control server listening on a Unix socket of the running TaskFlowX process.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+            self,
+            path: str,
+            workflows,
+            scheduler=None,
+            resources=None
+    ):
+        """
+        Constructor.
+
+        Args:
+        - path: The path of the Unix socket.
+        - workflows: The running workflow instances.
+        - scheduler: The LaneScheduler running the workflows.
+        - resources: The ResourceRegistry of the workflows.
+        """
+        # Remove a stale socket, but never the socket of a running instance
+        if os.path.exists(path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(path)
+            else:
+                raise RuntimeError(f"Control socket {path} is in use by another TaskFlowX instance")
+            finally:
+                probe.close()
+            # end try
+        # end if
+        super().__init__(path, ControlHandler)
+        self.path = path
+        self.workflows = {workflow.__class__.__name__: workflow for workflow in workflows}
+        self.scheduler = scheduler
+        self.resources = resources
+    # end __init__
+
+    # Dispatch a command
+    def dispatch(self, command, **params):
+        """
+        Execute a control command.
+
+        Args:
+        - command: The command name.
+        - params: The command parameters.
+
+        Returns:
+        - A dictionary with the command result.
+        """
+        if command == "workflows":
+            return {"workflows": sorted(self.workflows)}
+        elif command == "lanes":
+            return {"lanes": self.scheduler.stats() if self.scheduler is not None else {}}
+        elif command == "resources":
+            return {"resources": self.resources.stats() if self.resources is not None else {}}
+        elif command == "profile":
+            workflow = params["workflow"]
+            if workflow not in self.workflows:
+                raise ValueError(f"Unknown workflow: {workflow}")
+            # end if
+            return profile_workflow(
+                workflow_name=workflow,
+                seconds=float(params.get("seconds", 30)),
+                output=params["output"],
+                mode=params.get("mode", DEFAULT_PROFILE_MODE)
+            )
+        # end if
+        raise ValueError(f"Unknown command: {command}")
+    # end dispatch
+
+    # Close the server
+    def server_close(self):
+        """
+        Close the server and remove the socket file.
+        """
+        super().server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        # end if
+    # end server_close
+
+# end ControlServer
+
+
+# Send a command
+def send_command(
+        path: str,
+        command: str,
+        timeout: float = None,
+        **params
+):
+    """
+    Send a command to the control socket of a running TaskFlowX process.
+
+    Args:
+    - path: The path of the Unix socket.
+    - command: The command name.
+    - timeout: The maximum time to wait for the answer, in seconds.
+    - params: The command parameters.
+
+    Returns:
+    - The decoded answer.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(json.dumps({"command": command, **params}).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            response = json.loads(f.readline())
+        # end with
+    # end with
+
+    # Raise errors
+    if response.pop("status") != "ok":
+        raise RuntimeError(response["message"])
+    # end if
+
+    return response
+# end send_command
+
@@ -0,0 +1,299 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import math
+import threading
+from concurrent.futures import Future
+from .logger import logger
+from .payload import spooled_payloads
+from .scheduler import DEFAULT_LANE
+from .windows import WindowedAggregation
+
+
+# Event dispatcher
+class Dispatcher:
+    """
+    Fan the events of a trigger out to the workflows subscribed to it.
+    """
+
+    def __init__(
+            self,
+            workflows,
+            scheduler=None,
+            workflow_lanes: dict = None,
+            tick: float = 1.0
+    ):
+        """
+        Constructor.
+
+        Args:
+        - workflows: The workflow instances.
+        - scheduler: The LaneScheduler running the workflows, None to run them in the trigger thread.
+        - workflow_lanes: The priority lane of workflows, by workflow name.
+        - tick: The interval in seconds between two checks for closed windows.
+        """
+        self.workflows = list(workflows)
+        self.scheduler = scheduler
+        self.workflow_lanes = workflow_lanes or {}
+        self.tick = tick
+        self._subscribers = {}
+        self.trigger_lanes = {}
+        self._stop = threading.Event()
+        self._ticker = None
+
+        # Window aggregations of the windowed handlers, by trigger name
+        self.windows = {}
+        for workflow in self.workflows:
+            for method in dir(workflow):
+                func = getattr(workflow, method)
+                if hasattr(func, "_window") and hasattr(func, "_trigger"):
+                    self.windows.setdefault(func._trigger, []).append(
+                        (workflow, method, WindowedAggregation(**func._window))
+                    )
+                # end if
+            # end for
+        # end for
+    # end __init__
+
+    # Subscribed workflows
+    def subscribers(self, trigger_name: str):
+        """
+        Get the workflows with at least one handler for a trigger.
+
+        Args:
+        - trigger_name: The name of the trigger.
+
+        Returns:
+        - A list of workflows.
+        """
+        if trigger_name not in self._subscribers:
+            self._subscribers[trigger_name] = [
+                workflow for workflow in self.workflows if workflow.handlers(trigger_name)
+            ]
+        # end if
+        return self._subscribers[trigger_name]
+    # end subscribers
+
+    # Lane of a workflow
+    def lane(self, workflow, trigger_lane: str = None):
+        """
+        Get the priority lane of a workflow execution.
+
+        The lane configured for the workflow wins over its priority attribute, then over the lane of the trigger,
+        then over the default lane of the scheduler.
+
+        Args:
+        - workflow: The workflow.
+        - trigger_lane: The lane of the trigger.
+
+        Returns:
+        - The name of the lane.
+        """
+        return (
+            self.workflow_lanes.get(workflow.__class__.__name__)
+            or workflow.priority
+            or trigger_lane
+            or (self.scheduler.default if self.scheduler is not None else DEFAULT_LANE)
+        )
+    # end lane
+
+    # Callback for a trigger
+    def callback(self, trigger_name: str, lane: str = None):
+        """
+        Build the callback given to a trigger.
+
+        Args:
+        - trigger_name: The name of the trigger.
+        - lane: The priority lane of the trigger.
+
+        Returns:
+        - A function dispatching the events of the trigger, returning the futures of the executions.
+        """
+        # Lane of the windows closed by the ticker
+        if lane is not None:
+            self.trigger_lanes[trigger_name] = lane
+        # end if
+
+        def dispatch(*args, **kwargs):
+            return self.dispatch(trigger_name, lane, *args, **kwargs)
+        # end dispatch
+        return dispatch
+    # end callback
+
+    # Dispatch an event
+    def dispatch(self, trigger_name: str, lane: str, *args, **kwargs):
+        """
+        Run or queue the subscribed workflows on an event.
+
+        Args:
+        - trigger_name: The name of the trigger.
+        - lane: The priority lane of the trigger.
+
+        Returns:
+        - The futures resolved when each subscribed workflow has finished with the event.
+        """
+        # Windowed handlers only aggregate the event
+        for workflow, handler, aggregation in self.windows.get(trigger_name, ()):
+            for result in aggregation.add(args[0] if args else None):
+                self.emit(workflow, handler, result, lane)
+            # end for
+        # end for
+
+        # Spooled payloads are reclaimed once every subscriber has finished
+        payloads = spooled_payloads(*args, **kwargs)
+        futures = []
+        try:
+            for workflow in self.subscribers(trigger_name):
+                for payload in payloads:
+                    payload.acquire()
+                # end for
+                future = Future()
+                futures.append(future)
+                if self.scheduler is None:
+                    self.execute(workflow, trigger_name, payloads, args, kwargs, future)
+                    continue
+                # end if
+                try:
+                    self.scheduler.submit(
+                        self.lane(workflow, lane), self.execute, workflow, trigger_name, payloads, args, kwargs, future
+                    )
+                except Exception:
+                    for payload in payloads:
+                        payload.release()
+                    # end for
+                    raise
+                # end try
+            # end for
+        finally:
+            # Release the reference of the trigger
+            for payload in payloads:
+                payload.release()
+            # end for
+        # end try
+        return futures
+    # end dispatch
+
+    # Execute a workflow
+    def execute(self, workflow, trigger_name: str, payloads, args, kwargs, future: Future = None):
+        """
+        Run a workflow on an event and release its references to the spooled payloads.
+
+        Args:
+        - workflow: The workflow.
+        - trigger_name: The name of the trigger.
+        - payloads: The spooled payloads of the event.
+        - args: The positional arguments of the event.
+        - kwargs: The keyword arguments of the event.
+        - future: The future resolved when the workflow has finished, with the error of a failed workflow.
+        """
+        error = None
+        try:
+            workflow.run(trigger_name, *args, **kwargs)
+        except Exception as e:
+            error = e
+            logger.exception(f"Workflow {workflow.__class__.__name__} failed on '{trigger_name}'", exc_info=e)
+        finally:
+            for payload in payloads:
+                payload.release()
+            # end for
+            if future is not None:
+                future.set_result(error)
+            # end if
+        # end try
+    # end execute
+
+    # Emit a window result
+    def emit(self, workflow, handler: str, result: dict, lane: str = None):
+        """
+        Run or queue a windowed handler on a closed window.
+
+        Args:
+        - workflow: The workflow.
+        - handler: The name of the handler.
+        - result: The window result.
+        - lane: The priority lane of the trigger.
+        """
+        if self.scheduler is None:
+            self.execute_window(workflow, handler, result)
+        else:
+            self.scheduler.submit(self.lane(workflow, lane), self.execute_window, workflow, handler, result)
+        # end if
+    # end emit
+
+    # Execute a windowed handler
+    def execute_window(self, workflow, handler: str, result: dict):
+        """
+        Run a windowed handler on a window result.
+
+        Args:
+        - workflow: The workflow.
+        - handler: The name of the handler.
+        - result: The window result.
+        """
+        try:
+            workflow.run_window(handler, result)
+        except Exception as e:
+            logger.exception(f"Workflow {workflow.__class__.__name__} failed on window of {handler}", exc_info=e)
+        # end try
+    # end execute_window
+
+    # Close the windows
+    def expire(self, now: float = None):
+        """
+        Emit the results of the windows which ended.
+
+        Args:
+        - now: The current time, math.inf closes every window.
+        """
+        for trigger_name, aggregations in self.windows.items():
+            lane = self.trigger_lanes.get(trigger_name)
+            for workflow, handler, aggregation in aggregations:
+                for result in aggregation.expire(now):
+                    self.emit(workflow, handler, result, lane)
+                # end for
+            # end for
+        # end for
+    # end expire
+
+    # Start
+    def start(self):
+        """
+        Start closing windows in a background thread, if any handler is windowed.
+        """
+        if not self.windows:
+            return
+        # end if
+        def run():
+            while not self._stop.wait(self.tick):
+                self.expire()
+            # end while
+        # end run
+        self._ticker = threading.Thread(target=run, name="taskflowx-windows", daemon=True)
+        self._ticker.start()
+    # end start
+
+    # Stop
+    def stop(self):
+        """
+        Stop the window thread and emit the open windows.
+        """
+        self._stop.set()
+        if self._ticker is not None:
+            self._ticker.join()
+        # end if
+        self.expire(math.inf)
+    # end stop
+
+# end Dispatcher
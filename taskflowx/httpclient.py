@@ -0,0 +1,431 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import json
+import time
+import queue
+import select
+import threading
+import http.client
+from urllib.parse import urlsplit, urljoin
+
+
+# Errors raised when a kept-alive connection was closed by the server
+STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest, ConnectionResetError, BrokenPipeError)
+
+
+# HTTP response
+class HTTPResponse:
+    """
+    Fully read HTTP response.
+    """
+
+    def __init__(
+            self,
+            status: int,
+            reason: str,
+            headers,
+            body: bytes
+    ):
+        """
+        Constructor.
+
+        Args:
+        - status: The status code.
+        - reason: The reason phrase.
+        - headers: The response headers.
+        - body: The response body.
+        """
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+    # end __init__
+
+    # JSON
+    def json(self):
+        """
+        Parse the body as JSON.
+
+        Returns:
+        - The decoded JSON document.
+        """
+        return json.loads(self.body)
+    # end json
+
+# end HTTPResponse
+
+
+# Connection pool
+class ConnectionPool:
+    """
+    Pool of keep-alive HTTP(S) connections, kept per host.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 4,
+            timeout: float = 30,
+            max_connections: int = None,
+            wait_timeout: float = 30,
+            idle_timeout: float = 60
+    ):
+        """
+        Constructor.
+
+        Args:
+        - maxsize: The maximum number of idle connections kept per host.
+        - timeout: The default socket timeout in seconds.
+        - max_connections: The maximum number of concurrent requests per host, unbounded if None.
+        - wait_timeout: The time in seconds to wait for a free connection when max_connections is reached.
+        - idle_timeout: The idle time in seconds after which a kept-alive connection is not reused.
+        """
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.wait_timeout = wait_timeout
+        self.idle_timeout = idle_timeout
+        self._idle = {}
+        self._slots = {}
+        self._lock = threading.Lock()
+    # end __init__
+
+    # Get the connection slots of a host
+    def _host_slots(self, key):
+        """
+        Get the semaphore bounding the concurrent requests to a host.
+
+        Args:
+        - key: The (scheme, host, port) tuple.
+        """
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.max_connections)
+            # end if
+            return self._slots[key]
+        # end with
+    # end _host_slots
+
+    # Stale connection
+    def _stale(self, conn, idle_since):
+        """
+        Check whether an idle connection should not be reused.
+
+        Args:
+        - conn: The connection.
+        - idle_since: The time the connection became idle.
+
+        Returns:
+        - True if the connection idled too long, was closed, or has unexpected data pending.
+        """
+        if self.idle_timeout is not None and time.monotonic() - idle_since > self.idle_timeout:
+            return True
+        # end if
+        if conn.sock is None:
+            return True
+        # end if
+        try:
+            # An idle connection is readable only if the server closed it
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+            return bool(readable)
+        except (OSError, ValueError):
+            return True
+        # end try
+    # end _stale
+
+    # Get the idle connections of a host
+    def _host_queue(self, key):
+        """
+        Get the queue of idle connections of a host.
+
+        Args:
+        - key: The (scheme, host, port) tuple.
+        """
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue(maxsize=self.maxsize)
+            # end if
+            return self._idle[key]
+        # end with
+    # end _host_queue
+
+    # Get a connection
+    def _get(self, key, timeout):
+        """
+        Take an idle connection or open a new one.
+
+        Args:
+        - key: The (scheme, host, port) tuple.
+        - timeout: The socket timeout.
+
+        Returns:
+        - The connection and whether it was reused.
+        """
+        idle = self._host_queue(key)
+        while True:
+            try:
+                conn, idle_since = idle.get_nowait()
+            except queue.Empty:
+                scheme, host, port = key
+                conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+                return conn_class(host, port, timeout=timeout), False
+            # end try
+            if self._stale(conn, idle_since):
+                conn.close()
+                continue
+            # end if
+            conn.timeout = timeout
+            conn.sock.settimeout(timeout)
+            return conn, True
+        # end while
+    # end _get
+
+    # Give a connection back
+    def _put(self, key, conn):
+        """
+        Keep a connection for later use, or close it if the pool is full.
+
+        Args:
+        - key: The (scheme, host, port) tuple.
+        - conn: The connection.
+        """
+        try:
+            self._host_queue(key).put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            conn.close()
+        # end try
+    # end _put
+
+    # Send a request
+    def request(
+            self,
+            method: str,
+            url: str,
+            headers: dict = None,
+            body=None,
+            timeout: float = None
+    ):
+        """
+        Send a request on a pooled connection.
+
+        Args:
+        - method: The HTTP method.
+        - url: The URL.
+        - headers: The request headers.
+        - body: The request body.
+        - timeout: The socket timeout, defaults to the pool timeout.
+
+        Returns:
+        - An HTTPResponse.
+
+        Raises:
+        - TimeoutError: If max_connections requests to the host are still running after wait_timeout.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        # end if
+
+        # Wait for a free connection to the host
+        if self.max_connections is None:
+            return self._send(key, method, path, headers, body, timeout)
+        # end if
+        slots = self._host_slots(key)
+        if not slots.acquire(timeout=self.wait_timeout):
+            raise TimeoutError(f"No connection to {parts.hostname} available after {self.wait_timeout}s")
+        # end if
+        try:
+            return self._send(key, method, path, headers, body, timeout)
+        finally:
+            slots.release()
+        # end try
+    # end request
+
+    # Send a request on a connection
+    def _send(self, key, method, path, headers, body, timeout):
+        """
+        Send a request on an idle or new connection of a host.
+
+        Args:
+        - key: The (scheme, host, port) tuple.
+        - method: The HTTP method.
+        - path: The request path and query.
+        - headers: The request headers.
+        - body: The request body.
+        - timeout: The socket timeout.
+
+        Returns:
+        - An HTTPResponse.
+        """
+        while True:
+            conn, reused = self._get(key, timeout or self.timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except STALE_ERRORS:
+                conn.close()
+                # Retry once on a fresh connection if the server closed an idle one
+                if reused:
+                    continue
+                # end if
+                raise
+            except Exception:
+                conn.close()
+                raise
+            # end try
+
+            # Keep the connection alive unless the server closes it
+            if response.will_close:
+                conn.close()
+            else:
+                self._put(key, conn)
+            # end if
+
+            return HTTPResponse(response.status, response.reason, response.headers, data)
+        # end while
+    # end _send
+
+    # Close
+    def close(self):
+        """
+        Close every idle connection.
+        """
+        with self._lock:
+            queues = list(self._idle.values())
+            self._idle = {}
+        # end with
+        for idle in queues:
+            while True:
+                try:
+                    idle.get_nowait()[0].close()
+                except queue.Empty:
+                    break
+                # end try
+            # end while
+        # end for
+    # end close
+
+# end ConnectionPool
+
+
+# HTTP session
+class HttpSession:
+    """
+    Client for one service, with a base URL and default headers, sending requests on pooled connections.
+    """
+
+    def __init__(
+            self,
+            base_url: str = "",
+            headers: dict = None,
+            pool: ConnectionPool = None,
+            timeout: float = None
+    ):
+        """
+        Constructor.
+
+        Args:
+        - base_url: The URL relative request URLs are resolved against.
+        - headers: The headers sent with every request.
+        - pool: The connection pool, the default pool if None.
+        - timeout: The default request timeout in seconds.
+        """
+        self.base_url = base_url
+        self.headers = headers or {}
+        self.pool = pool or default_pool
+        self.timeout = timeout
+    # end __init__
+
+    # Send a request
+    def request(
+            self,
+            method: str,
+            url: str,
+            headers: dict = None,
+            body=None,
+            json_body=None,
+            timeout: float = None
+    ):
+        """
+        Send a request.
+
+        Args:
+        - method: The HTTP method.
+        - url: The URL, relative to the base URL.
+        - headers: Additional request headers.
+        - body: The request body.
+        - json_body: A document sent as a JSON body.
+        - timeout: The request timeout in seconds.
+
+        Returns:
+        - An HTTPResponse.
+        """
+        request_headers = {**self.headers, **(headers or {})}
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            request_headers.setdefault("Content-Type", "application/json")
+        # end if
+        return self.pool.request(
+            method,
+            urljoin(self.base_url, url),
+            headers=request_headers,
+            body=body,
+            timeout=timeout or self.timeout
+        )
+    # end request
+
+    # GET
+    def get(self, url: str, **kwargs):
+        """
+        Send a GET request.
+
+        Args:
+        - url: The URL, relative to the base URL.
+        """
+        return self.request("GET", url, **kwargs)
+    # end get
+
+    # POST
+    def post(self, url: str, **kwargs):
+        """
+        Send a POST request.
+
+        Args:
+        - url: The URL, relative to the base URL.
+        """
+        return self.request("POST", url, **kwargs)
+    # end post
+
+    # Close
+    def close(self):
+        """
+        Close the idle connections of the session pool.
+        """
+        if self.pool is not default_pool:
+            self.pool.close()
+        # end if
+    # end close
+
+# end HttpSession
+
+
+# Default pool, shared by the built-in triggers
+default_pool = ConnectionPool()
+
@@ -0,0 +1,345 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import os
+import io
+import json
+import mmap
+import shutil
+import tempfile
+import threading
+from .logger import logger
+
+
+# Default spool threshold (1 MiB)
+DEFAULT_THRESHOLD = 1024 * 1024
+
+# Copy chunk size
+CHUNK_SIZE = 64 * 1024
+
+
+# Payload spilled to the spool directory
+class SpooledPayload:
+    """
+    Large payload stored in a spool file and exposed through a memory-mapped view.
+
+    The file is removed when the last reference is released.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            size: int,
+            encoding: str = "utf-8"
+    ):
+        """
+        Constructor.
+
+        Args:
+        - path: The path of the spool file.
+        - size: The size of the payload in bytes.
+        - encoding: The encoding used to decode the payload as text.
+        """
+        self.path = path
+        self.size = size
+        self.encoding = encoding
+        self._refs = 1
+        self._map = None
+        self._lock = threading.Lock()
+    # end __init__
+
+    # Length
+    def __len__(self):
+        """
+        Size of the payload in bytes.
+        """
+        return self.size
+    # end __len__
+
+    # Text representation
+    def __str__(self):
+        """
+        Payload decoded as text.
+        """
+        return self.text()
+    # end __str__
+
+    # Representation
+    def __repr__(self):
+        """
+        Representation of the payload.
+        """
+        return f"SpooledPayload(path={self.path!r}, size={self.size})"
+    # end __repr__
+
+    # Memory-mapped view
+    def view(self):
+        """
+        Get a read-only memory-mapped view of the payload.
+
+        Returns:
+        - An mmap object, supporting slicing, find() and read().
+        """
+        with self._lock:
+            if self._map is None:
+                if self._refs <= 0:
+                    raise ValueError("Spooled payload already released")
+                # end if
+                if self.size == 0:
+                    return b""
+                # end if
+                with open(self.path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                # end with
+            # end if
+            return self._map
+        # end with
+    # end view
+
+    # File-like view
+    def open(self):
+        """
+        Open the payload as a binary file.
+
+        Returns:
+        - A binary file object.
+        """
+        return open(self.path, "rb")
+    # end open
+
+    # Bytes
+    def bytes(self):
+        """
+        Load the whole payload in memory.
+
+        Returns:
+        - The payload as bytes.
+        """
+        return bytes(self.view())
+    # end bytes
+
+    # Text
+    def text(self):
+        """
+        Load the whole payload as text.
+
+        Returns:
+        - The decoded payload.
+        """
+        with io.TextIOWrapper(self.open(), encoding=self.encoding) as f:
+            return f.read()
+        # end with
+    # end text
+
+    # JSON
+    def json(self):
+        """
+        Parse the payload as JSON.
+
+        Returns:
+        - The decoded JSON document.
+        """
+        with self.open() as f:
+            return json.load(f)
+        # end with
+    # end json
+
+    # Acquire a reference
+    def acquire(self):
+        """
+        Add a reference to the payload.
+        """
+        with self._lock:
+            if self._refs <= 0:
+                raise ValueError("Spooled payload already released")
+            # end if
+            self._refs += 1
+        # end with
+    # end acquire
+
+    # Release a reference
+    def release(self):
+        """
+        Remove a reference to the payload, and reclaim the spool file with the last one.
+        """
+        with self._lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            # end if
+
+            # Unmap, views still exported are left to the garbage collector
+            if self._map is not None:
+                try:
+                    self._map.close()
+                except BufferError:
+                    pass
+                # end try
+                self._map = None
+            # end if
+        # end with
+
+        # Remove the file
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        # end try
+    # end release
+
+# end SpooledPayload
+
+
+# Spool directory
+class Spool:
+    """
+    Spill payloads above a size threshold to a local spool directory.
+    """
+
+    def __init__(
+            self,
+            directory: str = None,
+            threshold: int = DEFAULT_THRESHOLD
+    ):
+        """
+        Constructor.
+
+        Args:
+        - directory: The spool directory, a temporary directory by default.
+        - threshold: The size in bytes above which payloads are spilled.
+        """
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "taskflowx-spool")
+        self.threshold = threshold
+    # end __init__
+
+    # Configure
+    def configure(
+            self,
+            directory: str = None,
+            threshold: int = None
+    ):
+        """
+        Change the spool settings.
+
+        Args:
+        - directory: The spool directory.
+        - threshold: The size in bytes above which payloads are spilled.
+        """
+        if directory is not None:
+            self.directory = directory
+        # end if
+        if threshold is not None:
+            self.threshold = threshold
+        # end if
+    # end configure
+
+    # Create a spool file
+    def _create(self):
+        """
+        Create a new spool file.
+
+        Returns:
+        - The file descriptor and the path of the file.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        return tempfile.mkstemp(dir=self.directory, suffix=".payload")
+    # end _create
+
+    # Spool a payload
+    def spool(
+            self,
+            data,
+            encoding: str = "utf-8"
+    ):
+        """
+        Spill a payload to the spool directory if it is above the threshold.
+
+        Args:
+        - data: The payload, str or bytes.
+        - encoding: The encoding of the payload.
+
+        Returns:
+        - The payload unchanged, or a SpooledPayload.
+        """
+        # Small payloads stay in memory
+        if not isinstance(data, (str, bytes)) or len(data) <= self.threshold:
+            return data
+        # end if
+
+        # Write the file
+        if isinstance(data, str):
+            data = data.encode(encoding)
+        # end if
+        fd, path = self._create()
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # end with
+        logger.debug(f"Payload of {len(data)} bytes spooled to {path}")
+
+        return SpooledPayload(path, len(data), encoding)
+    # end spool
+
+    # Spool a stream
+    def spool_stream(
+            self,
+            stream,
+            encoding: str = "utf-8"
+    ):
+        """
+        Copy a binary stream to the spool directory without loading it in memory.
+
+        Args:
+        - stream: The binary stream to copy.
+        - encoding: The encoding of the payload.
+
+        Returns:
+        - A SpooledPayload.
+        """
+        fd, path = self._create()
+        with os.fdopen(fd, "wb") as f:
+            shutil.copyfileobj(stream, f, CHUNK_SIZE)
+            size = f.tell()
+        # end with
+        logger.debug(f"Payload of {size} bytes spooled to {path}")
+
+        return SpooledPayload(path, size, encoding)
+    # end spool_stream
+
+# end Spool
+
+
+# Get spooled payloads from event arguments
+def spooled_payloads(*args, **kwargs):
+    """
+    Find the spooled payloads passed as event arguments or as values of dictionary arguments.
+
+    Returns:
+    - A list of SpooledPayload.
+    """
+    payloads = []
+    for value in list(args) + list(kwargs.values()):
+        if isinstance(value, SpooledPayload):
+            payloads.append(value)
+        elif isinstance(value, dict):
+            payloads.extend(v for v in value.values() if isinstance(v, SpooledPayload))
+        # end if
+    # end for
+    return payloads
+# end spooled_payloads
+
+
+# Default spool
+spool = Spool()
+
@@ -0,0 +1,366 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import sys
+import time
+import cProfile
+import pstats
+import threading
+from collections import Counter
+from .logger import logger
+
+
+# Active profiling sessions, by workflow name
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+# Get the active session of a workflow
+def active_session(workflow_name: str):
+    """
+    Get the profiling session attached to a workflow, if any.
+
+    Args:
+    - workflow_name: The name of the workflow.
+
+    Returns:
+    - The active session, or None when the workflow is not being profiled.
+    """
+    return _sessions.get(workflow_name)
+# end active_session
+
+
+# Deterministic profiling session
+class ProfileSession:
+    """
+    Deterministic profiling session based on cProfile, written as a pstats file.
+    """
+
+    # File extension
+    extension = "pstats"
+
+    def __init__(
+            self,
+            workflow_name: str
+    ):
+        """
+        Constructor.
+
+        Args:
+        - workflow_name: The name of the profiled workflow.
+        """
+        self.workflow_name = workflow_name
+        self.calls = 0
+        self.profiled = 0
+        self._lock = threading.Lock()
+        self._profiler = None
+        self._profiler_lock = threading.Lock()
+    # end __init__
+
+    # Start the session
+    def start(self):
+        """
+        Start the session.
+        """
+        pass
+    # end start
+
+    # Stop the session
+    def stop(self):
+        """
+        Stop the session.
+        """
+        pass
+    # end stop
+
+    # Profile a call
+    def profile(self, func, *args, **kwargs):
+        """
+        Run a handler execution under the profiler.
+
+        One profiler is shared by the session and profiles one execution at a time, as cProfile cannot
+        run several times at once (Python 3.12+). Concurrent executions, or executions for which the
+        profiler cannot be enabled, run unprofiled. From Python 3.12 the profiler records every thread,
+        so calls of other workflows running meanwhile are included.
+
+        Args:
+        - func: The function to call.
+        """
+        try:
+            # Profiler busy, run unprofiled
+            if not self._profiler_lock.acquire(blocking=False):
+                return func(*args, **kwargs)
+            # end if
+            try:
+                # Enable the profiler, another tool may hold the profiling hooks
+                try:
+                    if self._profiler is None:
+                        self._profiler = cProfile.Profile()
+                    # end if
+                    self._profiler.enable()
+                except Exception as e:
+                    logger.debug(f"Cannot enable profiler for '{self.workflow_name}': {e}")
+                    return func(*args, **kwargs)
+                # end try
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._profiler.disable()
+                    self.profiled += 1
+                # end try
+            finally:
+                self._profiler_lock.release()
+            # end try
+        finally:
+            with self._lock:
+                self.calls += 1
+            # end with
+        # end try
+    # end profile
+
+    # Write the result
+    def dump(self, output: str):
+        """
+        Write the collected statistics to a pstats file.
+
+        Args:
+        - output: The output file path.
+
+        Returns:
+        - True if the file was written, False if no execution was profiled.
+        """
+        with self._profiler_lock:
+            if not self.profiled:
+                return False
+            # end if
+            pstats.Stats(self._profiler).dump_stats(output)
+        # end with
+        return True
+    # end dump
+
+# end ProfileSession
+
+
+# Sampling profiling session
+class SampleSession(ProfileSession):
+    """
+    Statistical profiling session, written as collapsed stacks for flame graphs.
+    """
+
+    # File extension
+    extension = "collapsed"
+
+    def __init__(
+            self,
+            workflow_name: str,
+            interval: float = 0.005
+    ):
+        """
+        Constructor.
+
+        Args:
+        - workflow_name: The name of the profiled workflow.
+        - interval: The sampling interval in seconds.
+        """
+        super().__init__(workflow_name)
+        self.interval = interval
+        self.samples = 0
+        self._stacks = Counter()
+        self._threads = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+    # end __init__
+
+    # Start the session
+    def start(self):
+        """
+        Start the sampling thread.
+        """
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread.start()
+    # end start
+
+    # Stop the session
+    def stop(self):
+        """
+        Stop the sampling thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        # end if
+    # end stop
+
+    # Profile a call
+    def profile(self, func, *args, **kwargs):
+        """
+        Run a handler execution while its thread is being sampled.
+
+        Args:
+        - func: The function to call.
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._threads[thread_id] += 1
+        # end with
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.calls += 1
+                self._threads[thread_id] -= 1
+                if self._threads[thread_id] <= 0:
+                    del self._threads[thread_id]
+                # end if
+            # end with
+        # end try
+    # end profile
+
+    # Sampling loop
+    def _sample_loop(self):
+        """
+        Sample the stacks of the threads running the workflow.
+        """
+        # Frames above this code belong to the engine, not the workflow
+        root_code = SampleSession.profile.__code__
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                thread_ids = list(self._threads)
+            # end with
+            if not thread_ids:
+                continue
+            # end if
+            frames = sys._current_frames()
+            for thread_id in thread_ids:
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None and frame.f_code is not root_code:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                # end while
+                if stack:
+                    with self._lock:
+                        self._stacks[";".join(reversed(stack))] += 1
+                        self.samples += 1
+                    # end with
+                # end if
+            # end for
+        # end while
+    # end _sample_loop
+
+    # Write the result
+    def dump(self, output: str):
+        """
+        Write the collected stacks in the collapsed format.
+
+        Args:
+        - output: The output file path.
+
+        Returns:
+        - True if the file was written, False if no stack was sampled.
+        """
+        with self._lock:
+            if not self._stacks:
+                return False
+            # end if
+            with open(output, "w") as f:
+                for stack, count in self._stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+                # end for
+            # end with
+        # end with
+        return True
+    # end dump
+
+# end SampleSession
+
+
+# Profiling modes
+PROFILE_MODES = {
+    "cprofile": ProfileSession,
+    "sample": SampleSession
+}
+
+# Default mode, cProfile only sees the profiling thread before Python 3.12
+DEFAULT_PROFILE_MODE = "cprofile" if sys.version_info < (3, 12) else "sample"
+
+
+# Profile a workflow
+def profile_workflow(
+        workflow_name: str,
+        seconds: float,
+        output: str,
+        mode: str = DEFAULT_PROFILE_MODE
+):
+    """
+    Profile the handler executions of a workflow for a given duration.
+
+    Args:
+    - workflow_name: The name of the workflow.
+    - seconds: The profiling duration in seconds.
+    - output: The output file path.
+    - mode: The profiling mode, 'cprofile' or 'sample'.
+
+    Returns:
+    - A dictionary describing the profiling session, with no output if nothing was profiled.
+    """
+    # Check the mode
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profiling mode: {mode}")
+    # end if
+    if mode == "cprofile" and sys.version_info >= (3, 12):
+        logger.warning("cProfile records every thread from Python 3.12, other workflows may appear in the profile")
+    # end if
+
+    # Register the session
+    session = PROFILE_MODES[mode](workflow_name)
+    with _sessions_lock:
+        if workflow_name in _sessions:
+            raise RuntimeError(f"Workflow '{workflow_name}' is already being profiled")
+        # end if
+        session.start()
+        _sessions[workflow_name] = session
+    # end with
+
+    # Profile for the given duration
+    logger.info(f"Profiling workflow '{workflow_name}' for {seconds}s ({mode})")
+    try:
+        time.sleep(seconds)
+    finally:
+        with _sessions_lock:
+            del _sessions[workflow_name]
+        # end with
+        session.stop()
+    # end try
+
+    # Write the result
+    if session.dump(output):
+        logger.info(f"Profile of workflow '{workflow_name}' written to {output}")
+    else:
+        logger.info(f"No execution of workflow '{workflow_name}' was profiled")
+        output = None
+    # end if
+
+    return {
+        "workflow": workflow_name,
+        "mode": mode,
+        "seconds": seconds,
+        "calls": session.calls,
+        "profiled": session.profiled,
+        "output": output
+    }
+# end profile_workflow
+
@@ -0,0 +1,490 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import time
+import smtplib
+import importlib
+import threading
+from contextlib import contextmanager, nullcontext
+from .logger import logger
+from .httpclient import ConnectionPool, HttpSession
+
+
+# Pool of reusable resources
+class ResourcePool:
+    """
+    Bounded pool of connections, checked before reuse when they stayed idle for a while.
+    """
+
+    def __init__(
+            self,
+            factory,
+            check=None,
+            close=None,
+            reset=None,
+            max_size: int = 4,
+            timeout: float = 30,
+            check_after: float = 30
+    ):
+        """
+        Constructor.
+
+        Args:
+        - factory: The function opening a new connection.
+        - check: The function returning True if a connection is healthy.
+        - close: The function closing a connection.
+        - reset: The function cleaning a connection before it goes back to the pool, e.g. a rollback.
+        - max_size: The maximum number of open connections.
+        - timeout: The time in seconds to wait for a free connection.
+        - check_after: The idle time in seconds after which a connection is checked before reuse.
+        """
+        self.factory = factory
+        self.check = check
+        self.close_connection = close
+        self.reset = reset
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_after = check_after
+        self._idle = []
+        self._size = 0
+        self._cond = threading.Condition()
+    # end __init__
+
+    # Healthy connection
+    def healthy(self, conn):
+        """
+        Check a connection.
+
+        Args:
+        - conn: The connection.
+
+        Returns:
+        - True if the connection can be reused.
+        """
+        if self.check is None:
+            return True
+        # end if
+        try:
+            return bool(self.check(conn))
+        except Exception:
+            return False
+        # end try
+    # end healthy
+
+    # Discard a connection
+    def discard(self, conn):
+        """
+        Close a connection and free its slot.
+
+        Args:
+        - conn: The connection.
+        """
+        try:
+            if self.close_connection is not None:
+                self.close_connection(conn)
+            # end if
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+        finally:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            # end with
+        # end try
+    # end discard
+
+    # Acquire a connection
+    def acquire(self):
+        """
+        Take an idle connection or open a new one, waiting while the pool is exhausted.
+
+        Returns:
+        - A connection.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No connection available after {self.timeout}s")
+                    # end if
+                    self._cond.wait(remaining)
+                # end while
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                else:
+                    conn, idle_since = None, None
+                    self._size += 1
+                # end if
+            # end with
+
+            # Open a new connection
+            if conn is None:
+                try:
+                    return self.factory()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    # end with
+                    raise
+                # end try
+            # end if
+
+            # Check connections idle for a while
+            if time.monotonic() - idle_since < self.check_after or self.healthy(conn):
+                return conn
+            # end if
+            self.discard(conn)
+        # end while
+    # end acquire
+
+    # Release a connection
+    def release(self, conn, check: bool = False):
+        """
+        Reset a connection and give it back to the pool, or discard it if it cannot be reset.
+
+        Args:
+        - conn: The connection.
+        - check: Whether to check the connection before giving it back.
+        """
+        try:
+            if self.reset is not None:
+                self.reset(conn)
+            # end if
+        except Exception as e:
+            logger.debug(f"Error resetting pooled connection: {e}")
+            self.discard(conn)
+            return
+        # end try
+        if check and not self.healthy(conn):
+            self.discard(conn)
+            return
+        # end if
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+        # end with
+    # end release
+
+    # Lease a connection
+    @contextmanager
+    def connection(self):
+        """
+        Lease a connection for the duration of a with block.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            # The failure may come from the connection itself
+            self.release(conn, check=True)
+            raise
+        else:
+            self.release(conn)
+        # end try
+    # end connection
+
+    # Close
+    def close(self):
+        """
+        Close the idle connections.
+        """
+        with self._cond:
+            idle = self._idle
+            self._idle = []
+        # end with
+        for conn, _ in idle:
+            self.discard(conn)
+        # end for
+    # end close
+
+# end ResourcePool
+
+
+# HTTP session resource
+def create_http(
+        base_url: str = "",
+        headers: dict = None,
+        max_size: int = 4,
+        timeout: float = 30,
+        wait_timeout: float = 30,
+        idle_timeout: float = 60
+):
+    """
+    Create a pooled HTTP session.
+
+    Args:
+    - base_url: The base URL of the service.
+    - headers: The headers sent with every request.
+    - max_size: The maximum number of open connections per host.
+    - timeout: The request timeout in seconds.
+    - wait_timeout: The time in seconds to wait for a free connection.
+    - idle_timeout: The idle time in seconds after which a connection is not reused.
+    """
+    return HttpSession(
+        base_url=base_url,
+        headers=headers,
+        pool=ConnectionPool(
+            maxsize=max_size,
+            timeout=timeout,
+            max_connections=max_size,
+            wait_timeout=wait_timeout,
+            idle_timeout=idle_timeout
+        )
+    )
+# end create_http
+
+
+# DB-API connection pool
+def create_db(
+        driver: str,
+        args: list = None,
+        kwargs: dict = None,
+        check_query: str = "SELECT 1",
+        **settings
+):
+    """
+    Create a pool of DB-API connections.
+
+    Args:
+    - driver: The DB-API module, e.g. sqlite3 or psycopg2.
+    - args: The positional arguments of connect().
+    - kwargs: The keyword arguments of connect().
+    - check_query: The query used to check idle connections.
+    - settings: The pool settings (max_size, timeout, check_after).
+    """
+    module = importlib.import_module(driver)
+
+    # Check a connection
+    def check(conn):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(check_query)
+            cursor.fetchall()
+        finally:
+            cursor.close()
+        # end try
+        return True
+    # end check
+
+    return ResourcePool(
+        factory=lambda: module.connect(*(args or []), **(kwargs or {})),
+        check=check,
+        close=lambda conn: conn.close(),
+        reset=lambda conn: conn.rollback(),
+        **settings
+    )
+# end create_db
+
+
+# SMTP connection pool
+def create_smtp(
+        host: str,
+        port: int = 0,
+        username: str = None,
+        password: str = None,
+        ssl: bool = False,
+        starttls: bool = False,
+        connect_timeout: float = 30,
+        **settings
+):
+    """
+    Create a pool of authenticated SMTP connections.
+
+    Args:
+    - host: The SMTP server.
+    - port: The SMTP port, the default port of the protocol if 0.
+    - username: The login.
+    - password: The password.
+    - ssl: Whether to connect with implicit TLS.
+    - starttls: Whether to upgrade the connection with STARTTLS.
+    - connect_timeout: The socket timeout in seconds.
+    - settings: The pool settings (max_size, timeout, check_after).
+    """
+    # Open a connection
+    def connect():
+        smtp_class = smtplib.SMTP_SSL if ssl else smtplib.SMTP
+        conn = smtp_class(host, port, timeout=connect_timeout)
+        try:
+            if starttls:
+                conn.starttls()
+            # end if
+            if username:
+                conn.login(username, password)
+            # end if
+        except Exception:
+            conn.close()
+            raise
+        # end try
+        return conn
+    # end connect
+
+    # Close a connection
+    def close(conn):
+        try:
+            conn.quit()
+        except smtplib.SMTPException:
+            conn.close()
+        # end try
+    # end close
+
+    return ResourcePool(
+        factory=connect,
+        check=lambda conn: conn.noop()[0] == 250,
+        close=close,
+        **settings
+    )
+# end create_smtp
+
+
+# Email action
+def create_email(**settings):
+    """
+    Create a pooled, pipelined email sender (see EmailAction).
+
+    Args:
+    - settings: The EmailAction settings.
+    """
+    from .actions.email import EmailAction
+    return EmailAction(**settings)
+# end create_email
+
+
+# Resource types
+RESOURCE_TYPES = {
+    "http": create_http,
+    "db": create_db,
+    "smtp": create_smtp,
+    "email": create_email
+}
+
+# Resource types logging in with the SMTP credentials
+SMTP_TYPES = ("smtp", "email")
+
+
+# Resource registry
+class ResourceRegistry:
+    """
+    Shared resources declared in the configuration, created on first use.
+    """
+
+    def __init__(
+            self,
+            resources_config: dict = None,
+            credentials: dict = None
+    ):
+        """
+        Constructor.
+
+        Args:
+        - resources_config: The resource settings by resource name, each with a 'type' key.
+        - credentials: The credentials section of the configuration.
+        """
+        self.config = resources_config or {}
+        self.credentials = credentials or {}
+        for name, settings in self.config.items():
+            if settings.get("type") not in RESOURCE_TYPES:
+                raise ValueError(f"Unknown type for resource '{name}': {settings.get('type')}")
+            # end if
+        # end for
+        self._resources = {}
+        self._lock = threading.Lock()
+    # end __init__
+
+    # Get a resource
+    def get(self, name: str):
+        """
+        Get a resource, creating it on first use.
+
+        Args:
+        - name: The name of the resource.
+
+        Returns:
+        - The resource (HttpSession or ResourcePool).
+        """
+        with self._lock:
+            if name not in self._resources:
+                if name not in self.config:
+                    raise KeyError(f"Unknown resource: {name}")
+                # end if
+                settings = dict(self.config[name])
+                resource_type = settings.pop("type")
+
+                # SMTP logins default to the configured credentials
+                if resource_type in SMTP_TYPES:
+                    settings.setdefault("username", self.credentials.get("smtp_user"))
+                    settings.setdefault("password", self.credentials.get("smtp_pass"))
+                # end if
+
+                self._resources[name] = RESOURCE_TYPES[resource_type](**settings)
+                logger.info(f"Resource '{name}' created")
+            # end if
+            return self._resources[name]
+        # end with
+    # end get
+
+    # Lease a resource
+    def lease(self, name: str):
+        """
+        Lease a resource for the duration of a with block.
+
+        Pools lend one of their connections, other resources are given as is.
+
+        Args:
+        - name: The name of the resource.
+        """
+        resource = self.get(name)
+        if isinstance(resource, ResourcePool):
+            return resource.connection()
+        # end if
+        return nullcontext(resource)
+    # end lease
+
+    # Statistics
+    def stats(self):
+        """
+        Get the metrics of the created resources which expose some.
+
+        Returns:
+        - A dictionary of metrics by resource name.
+        """
+        with self._lock:
+            resources = dict(self._resources)
+        # end with
+        return {name: resource.stats() for name, resource in resources.items() if hasattr(resource, "stats")}
+    # end stats
+
+    # Close
+    def close(self):
+        """
+        Close every created resource.
+        """
+        with self._lock:
+            resources = list(self._resources.values())
+            self._resources = {}
+        # end with
+        for resource in resources:
+            try:
+                resource.close()
+            except Exception as e:
+                logger.error(f"Error closing resource: {e}")
+            # end try
+        # end for
+    # end close
+
+# end ResourceRegistry
+
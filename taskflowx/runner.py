@@ -16,8 +16,15 @@ import importlib
 import importlib.util
 import os
 import inspect
+import threading
 import taskflowx.triggers as tfx_triggers
 from .logger import logger
+from .control import ControlServer, DEFAULT_SOCKET
+from .dispatcher import Dispatcher
+from .scheduler import LaneScheduler, DEFAULT_LANES, DEFAULT_LANE
+from .payload import spool
+from .resources import ResourceRegistry
+from .state import StateStore
 from .workflows.base import Workflow
 from .triggers.base import Trigger
 
@@ -89,7 +96,7 @@ def load_dynamic_classes(directory):
             module_path = f"{directory.replace('/', '.')}.{module_name}"
             try:
                 module = importlib.import_module(module_path)
-                loaded_classes[module.trigger_name()] = module
+                loaded_classes[module_name] = module
                 logger.info(f"Module loaded: {module_name} from {module_path}")
             except Exception as e:
                 logger.error(f"Error loading module {module_name}: {e}")
@@ -109,7 +116,7 @@ def get_base_trigger_classes():
     # Add basic modules
     return {
         obj.trigger_name(): obj for name, obj in inspect.getmembers(tfx_triggers, inspect.isclass)
-        if issubclass(obj, Trigger) and obj is not Trigger
+        if issubclass(obj, Trigger) and not inspect.isabstract(obj)
     }
 # end get_base_trigger_classes
 
@@ -153,7 +160,8 @@ def instantiate_triggers(
             trigger_class = trigger_classes[trigger_type]
 
             # Instantiate the trigger
-            trigger = trigger_class(**{k: v for k, v in trigger_conf.items() if k != "type"})
+            trigger = trigger_class(**{k: v for k, v in trigger_conf.items() if k not in ("type", "priority")})
+            trigger.priority = trigger_conf.get("priority")
 
             # Add to trigger list
             if trigger:
@@ -187,6 +195,12 @@ def run(
     # Log
     logger.info("Starting TaskFlowX")
 
+    # Shared resources
+    resources = ResourceRegistry(config.get("resources", {}), credentials=config.get("credentials", {}))
+
+    # Durable workflow state
+    state_store = StateStore(**(config.get("state", {}) or {}))
+
     # Load workflows dynamically from the workflows directory
     workflow_modules = load_dynamic_classes(workflows_path)
     workflows = []
@@ -194,8 +208,10 @@ def run(
     # Instantiate workflows
     for module in workflow_modules.values():
         for name, obj in inspect.getmembers(module, inspect.isclass):
-            if issubclass(obj, Workflow) and obj is not Workflow:
-                workflows.append(obj())
+            if issubclass(obj, Workflow) and obj is not Workflow and obj.__module__ == module.__name__:
+                workflow = obj()
+                workflow.open(resources, state=state_store.namespace(name))
+                workflows.append(workflow)
                 logger.info(f"Workflow '{name}' chargé")
             # end if
         # end for
@@ -207,13 +223,85 @@ def run(
         triggers_path=triggers_path
     )
 
+    # Spool large payloads
+    spool.configure(**(config.get("spool", {}) or {}))
+
+    # Priority lanes
+    lanes_config = config.get("lanes", {}) or {}
+    scheduler = LaneScheduler(
+        lanes=lanes_config.get("classes", DEFAULT_LANES),
+        workers=lanes_config.get("workers", 4),
+        max_wait=lanes_config.get("max_wait", 10.0),
+        default=lanes_config.get("default", DEFAULT_LANE)
+    )
+    workflow_lanes = lanes_config.get("workflows", {}) or {}
+    for lane in list(workflow_lanes.values()) + [w.priority for w in workflows] + [t.priority for t in triggers]:
+        if lane is not None:
+            scheduler.lane(lane)
+        # end if
+    # end for
+
+    # Control socket, bound before anything runs so a second instance fails early
+    control_config = config.get("control", {}) or {}
+    server = None
+    if control_config.get("enabled", True):
+        server = ControlServer(
+            path=control_config.get("socket", DEFAULT_SOCKET),
+            workflows=workflows,
+            scheduler=scheduler,
+            resources=resources
+        )
+        logger.info(f"Control socket listening on {server.path}")
+    # end if
+    scheduler.start()
+
     # Lancer les triggers
+    dispatcher = Dispatcher(
+        workflows,
+        scheduler=scheduler,
+        workflow_lanes=workflow_lanes,
+        tick=config.get("window_tick", 1.0)
+    )
+    dispatcher.start()
     for trigger in triggers:
+        trigger_name = trigger.trigger_name()
+        subscribers = [workflow.__class__.__name__ for workflow in dispatcher.subscribers(trigger_name)]
+        logger.info(f"Starting trigger {trigger.__class__.__name__} for workflows {subscribers}")
+        trigger.start(dispatcher.callback(trigger_name, trigger.priority))
+    # end for
+
+    # Serve control commands until interrupted
+    try:
+        if server is not None:
+            server.serve_forever()
+        else:
+            threading.Event().wait()
+        # end if
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.server_close()
+        # end if
+
+        # Stop the triggers, finish the queued executions, then release the workflows
+        for trigger in triggers:
+            if hasattr(trigger, "stop"):
+                trigger.stop()
+            # end if
+        # end for
+        dispatcher.stop()
+        scheduler.stop()
         for workflow in workflows:
-            logger.info(f"Starting trigger {trigger.__class__.__name__} for workflow {workflow.__class__.__name__}")
-            trigger.start(workflow.run)
+            try:
+                workflow.close()
+            except Exception as e:
+                logger.exception(f"Error closing workflow {workflow.__class__.__name__}", exc_info=e)
+            # end try
         # end for
-    # end for
+        resources.close()
+        state_store.close()
+    # end try
 
     # Log stop
     logger.info("TaskFlowX stopped")
@@ -0,0 +1,315 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import time
+import threading
+from collections import deque
+from .logger import logger
+
+
+# Default priority lanes
+DEFAULT_LANES = {
+    "realtime": {"weight": 10, "reserved": 1},
+    "normal": {"weight": 5},
+    "bulk": {"weight": 1, "queue_size": 1000}
+}
+
+# Default lane
+DEFAULT_LANE = "normal"
+
+
+# Priority lane
+class Lane:
+    """
+    Queue of tasks sharing a priority class.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            weight: float = 1,
+            reserved: int = 0,
+            queue_size: int = 0
+    ):
+        """
+        Constructor.
+
+        Args:
+        - name: The name of the lane.
+        - weight: The share of the shared workers given to the lane.
+        - reserved: The number of workers dedicated to the lane.
+        - queue_size: The maximum number of queued tasks, 0 for unbounded.
+        """
+        if weight <= 0:
+            raise ValueError(f"Lane '{name}' must have a positive weight")
+        # end if
+        self.name = name
+        self.weight = weight
+        self.reserved = reserved
+        self.queue_size = queue_size
+        self.queue = deque()
+        self.vtime = 0.0
+        self.running = 0
+        self.completed = 0
+    # end __init__
+
+    # Full
+    def full(self):
+        """
+        Check if the lane queue is full.
+        """
+        return 0 < self.queue_size <= len(self.queue)
+    # end full
+
+    # Age of the oldest task
+    def wait_time(self, now: float):
+        """
+        Time spent in the queue by the oldest task.
+
+        Args:
+        - now: The current monotonic time.
+        """
+        return now - self.queue[0][0] if self.queue else 0.0
+    # end wait_time
+
+# end Lane
+
+
+# Lane scheduler
+class LaneScheduler:
+    """
+    Run tasks on a pool of workers with weighted-fair scheduling between priority lanes.
+
+    Each lane has its own reserved workers. Shared workers pick the non-empty lane with the smallest
+    virtual time, which advances by 1/weight per task (stride scheduling). A task waiting longer than
+    max_wait is run first, whatever its lane, so low-weight lanes are never starved.
+    """
+
+    def __init__(
+            self,
+            lanes: dict = None,
+            workers: int = 4,
+            max_wait: float = 10.0,
+            default: str = DEFAULT_LANE
+    ):
+        """
+        Constructor.
+
+        Args:
+        - lanes: The lane settings (weight, reserved, queue_size) by lane name.
+        - workers: The number of shared workers.
+        - max_wait: The waiting time in seconds after which a task is run first.
+        - default: The lane of tasks without a lane of their own.
+        """
+        self.lanes = {
+            name: Lane(name, **(settings or {}))
+            for name, settings in (lanes if lanes is not None else DEFAULT_LANES).items()
+        }
+        if default not in self.lanes:
+            raise ValueError(f"Unknown default priority lane: {default}")
+        # end if
+        self.default = default
+        self.workers = workers
+        self.max_wait = max_wait
+        self._vtime = 0.0
+        self._cond = threading.Condition()
+        self._threads = []
+        self._stopped = False
+    # end __init__
+
+    # Get a lane
+    def lane(self, name: str):
+        """
+        Get a lane by name.
+
+        Args:
+        - name: The name of the lane.
+
+        Returns:
+        - The lane.
+        """
+        if name not in self.lanes:
+            raise ValueError(f"Unknown priority lane: {name}")
+        # end if
+        return self.lanes[name]
+    # end lane
+
+    # Submit a task
+    def submit(self, lane_name: str, func, *args, **kwargs):
+        """
+        Queue a task in a lane, blocking while the lane is full.
+
+        Args:
+        - lane_name: The name of the lane.
+        - func: The function to call.
+        """
+        lane = self.lane(lane_name)
+        with self._cond:
+            while lane.full() and not self._stopped:
+                self._cond.wait()
+            # end while
+            if self._stopped:
+                raise RuntimeError("Scheduler stopped")
+            # end if
+
+            # A lane waking up does not keep credit from its idle time
+            if not lane.queue:
+                lane.vtime = max(lane.vtime, self._vtime)
+            # end if
+            lane.queue.append((time.monotonic(), func, args, kwargs))
+            self._cond.notify_all()
+        # end with
+    # end submit
+
+    # Pick the next task
+    def _pick(self, lanes):
+        """
+        Pick the next task among lanes, the condition being held.
+
+        Args:
+        - lanes: The candidate lanes.
+
+        Returns:
+        - The lane and the task, or None.
+        """
+        candidates = [lane for lane in lanes if lane.queue]
+        if not candidates:
+            return None
+        # end if
+
+        # Starving tasks first, then the smallest virtual time
+        now = time.monotonic()
+        starving = [lane for lane in candidates if lane.wait_time(now) > self.max_wait]
+        if starving:
+            lane = max(starving, key=lambda l: l.wait_time(now))
+        else:
+            lane = min(candidates, key=lambda l: l.vtime)
+        # end if
+
+        # Advance the virtual time
+        self._vtime = max(self._vtime, lane.vtime)
+        lane.vtime += 1.0 / lane.weight
+
+        return lane, lane.queue.popleft()
+    # end _pick
+
+    # Worker loop
+    def _work(self, lanes):
+        """
+        Run tasks from the given lanes until the scheduler stops.
+
+        Args:
+        - lanes: The lanes served by the worker.
+        """
+        while True:
+            with self._cond:
+                picked = self._pick(lanes)
+                while picked is None and not self._stopped:
+                    self._cond.wait()
+                    picked = self._pick(lanes)
+                # end while
+                if picked is None:
+                    return
+                # end if
+                lane, (_, func, args, kwargs) = picked
+                lane.running += 1
+                # Room for blocked producers
+                self._cond.notify_all()
+            # end with
+
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                logger.exception(f"Task failed in lane '{lane.name}'", exc_info=e)
+            finally:
+                with self._cond:
+                    lane.running -= 1
+                    lane.completed += 1
+                # end with
+            # end try
+        # end while
+    # end _work
+
+    # Start
+    def start(self):
+        """
+        Start the reserved and shared workers.
+        """
+        # Reserved workers
+        for lane in self.lanes.values():
+            for i in range(lane.reserved):
+                self._threads.append(threading.Thread(
+                    target=self._work, args=([lane],), name=f"taskflowx-{lane.name}-{i}", daemon=True
+                ))
+            # end for
+        # end for
+
+        # Shared workers
+        for i in range(self.workers):
+            self._threads.append(threading.Thread(
+                target=self._work, args=(list(self.lanes.values()),), name=f"taskflowx-worker-{i}", daemon=True
+            ))
+        # end for
+
+        for thread in self._threads:
+            thread.start()
+        # end for
+    # end start
+
+    # Stop
+    def stop(self, wait: bool = True):
+        """
+        Stop the workers once the queued tasks are done.
+
+        Args:
+        - wait: Whether to wait for the workers to finish.
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        # end with
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            # end for
+        # end if
+    # end stop
+
+    # Statistics
+    def stats(self):
+        """
+        Get the state of the lanes.
+
+        Returns:
+        - A dictionary of lane statistics by lane name.
+        """
+        now = time.monotonic()
+        with self._cond:
+            return {
+                lane.name: {
+                    "weight": lane.weight,
+                    "reserved": lane.reserved,
+                    "queued": len(lane.queue),
+                    "running": lane.running,
+                    "completed": lane.completed,
+                    "max_wait": round(lane.wait_time(now), 3)
+                }
+                for lane in self.lanes.values()
+            }
+        # end with
+    # end stats
+
+# end LaneScheduler
+
@@ -0,0 +1,453 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from .logger import logger
+
+
+# Marks deleted and missing keys
+DELETED = object()
+MISSING = object()
+
+
+# State store
+class StateStore:
+    """
+    Durable key-value store of the workflows, in an SQLite database in WAL mode.
+
+    Reads go through an in-memory cache. Writes update the cache and are committed in batches, in one
+    transaction every flush_interval seconds (or when max_pending writes are waiting), without a fsync
+    per write. A crash loses at most the writes of the last interval, never part of a batch. The database
+    is opened, and the commit thread started, on first use.
+    """
+
+    def __init__(
+            self,
+            path: str = "taskflowx-state.db",
+            flush_interval: float = 0.5,
+            max_pending: int = 10000,
+            cache_size: int = 100000
+    ):
+        """
+        Constructor.
+
+        Args:
+        - path: The SQLite database file.
+        - flush_interval: The time in seconds between two commits.
+        - max_pending: The number of buffered writes forcing a commit.
+        - cache_size: The maximum number of values kept in the cache.
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.cache_size = cache_size
+
+        # Database, opened on first use
+        self._db = None
+        self._db_lock = threading.Lock()
+
+        # Cache, buffered writes and writes being committed
+        self._cache = OrderedDict()
+        self._dirty = {}
+        self._flushing = {}
+        self._lock = threading.RLock()
+
+        # Commit thread, started by the first write
+        self._flush_needed = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+    # end __init__
+
+    # Open the database, the database lock being held
+    def _connection(self):
+        """
+        Get the database connection, opening the database on first use.
+
+        Returns:
+        - The sqlite3 connection.
+        """
+        if self._db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "workflow TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (workflow, key)) WITHOUT ROWID"
+            )
+            self._db = db
+            logger.info(f"Workflow state stored in {self.path}")
+        # end if
+        return self._db
+    # end _connection
+
+    # Namespace of a workflow
+    def namespace(self, workflow: str):
+        """
+        Get the state of a workflow.
+
+        Args:
+        - workflow: The name of the workflow.
+
+        Returns:
+        - A WorkflowState.
+        """
+        return WorkflowState(self, workflow)
+    # end namespace
+
+    # Read a value, the lock being held
+    def _load(self, item):
+        """
+        Get a value from the cache, the writes being committed or the database.
+
+        Args:
+        - item: The (workflow, key) tuple.
+
+        Returns:
+        - The value, or MISSING.
+        """
+        if item in self._cache:
+            self._cache.move_to_end(item)
+            return self._cache[item]
+        # end if
+
+        # Being committed
+        if item in self._flushing:
+            value = self._flushing[item]
+            value = MISSING if value is DELETED else value
+        else:
+            with self._db_lock:
+                row = self._connection().execute(
+                    "SELECT value FROM state WHERE workflow = ? AND key = ?", item
+                ).fetchone()
+            # end with
+            value = json.loads(row[0]) if row is not None else MISSING
+        # end if
+
+        self._cache[item] = value
+        self._evict()
+        return value
+    # end _load
+
+    # Write a value, the lock being held
+    def _store(self, item, value):
+        """
+        Update the cache and buffer the write.
+
+        Args:
+        - item: The (workflow, key) tuple.
+        - value: The new value, or MISSING to delete the key.
+        """
+        self._cache[item] = value
+        self._cache.move_to_end(item)
+        self._dirty[item] = DELETED if value is MISSING else value
+        if self._thread is None and not self._stop.is_set():
+            self._thread = threading.Thread(target=self._run, name="taskflowx-state", daemon=True)
+            self._thread.start()
+        # end if
+        if len(self._dirty) >= self.max_pending:
+            self._flush_needed.set()
+        # end if
+        self._evict()
+    # end _store
+
+    # Evict clean values
+    def _evict(self):
+        """
+        Remove the least recently used values which are not waiting to be committed.
+        """
+        if len(self._cache) <= self.cache_size:
+            return
+        # end if
+        for item in list(self._cache):
+            if len(self._cache) <= self.cache_size:
+                break
+            # end if
+            if item not in self._dirty:
+                del self._cache[item]
+            # end if
+        # end for
+    # end _evict
+
+    # Get
+    def get(self, workflow: str, key: str, default=None):
+        """
+        Get a value.
+
+        Args:
+        - workflow: The name of the workflow.
+        - key: The key.
+        - default: The value returned when the key does not exist.
+        """
+        with self._lock:
+            value = self._load((workflow, key))
+        # end with
+        return default if value is MISSING else value
+    # end get
+
+    # Set
+    def set(self, workflow: str, key: str, value):
+        """
+        Set a value.
+
+        Args:
+        - workflow: The name of the workflow.
+        - key: The key.
+        - value: The value, JSON serializable.
+        """
+        # Cache the value as it will be read back from the database
+        value = json.loads(json.dumps(value))
+        with self._lock:
+            self._store((workflow, key), value)
+        # end with
+    # end set
+
+    # Delete
+    def delete(self, workflow: str, key: str):
+        """
+        Delete a key.
+
+        Args:
+        - workflow: The name of the workflow.
+        - key: The key.
+        """
+        with self._lock:
+            self._store((workflow, key), MISSING)
+        # end with
+    # end delete
+
+    # Compare and set
+    def compare_and_set(self, workflow: str, key: str, expected, value):
+        """
+        Set a value only if the current value equals expected, atomically.
+
+        Args:
+        - workflow: The name of the workflow.
+        - key: The key.
+        - expected: The expected current value, None for a missing key.
+        - value: The new value.
+
+        Returns:
+        - True if the value was set.
+        """
+        value = json.loads(json.dumps(value))
+        with self._lock:
+            current = self._load((workflow, key))
+            if (None if current is MISSING else current) != expected:
+                return False
+            # end if
+            self._store((workflow, key), value)
+            return True
+        # end with
+    # end compare_and_set
+
+    # Increment
+    def increment(self, workflow: str, key: str, amount=1):
+        """
+        Add an amount to a numeric value atomically, missing keys counting as 0.
+
+        Args:
+        - workflow: The name of the workflow.
+        - key: The key.
+        - amount: The amount to add.
+
+        Returns:
+        - The new value.
+        """
+        with self._lock:
+            current = self._load((workflow, key))
+            value = (0 if current is MISSING else current) + amount
+            self._store((workflow, key), value)
+            return value
+        # end with
+    # end increment
+
+    # Commit the buffered writes
+    def flush(self):
+        """
+        Commit the buffered writes in one transaction.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            # end if
+            batch, self._dirty = self._dirty, {}
+            self._flushing = batch
+        # end with
+
+        try:
+            with self._db_lock:
+                db = self._connection()
+                db.execute("BEGIN")
+                try:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO state (workflow, key, value) VALUES (?, ?, ?)",
+                        [(w, k, json.dumps(v)) for (w, k), v in batch.items() if v is not DELETED]
+                    )
+                    db.executemany(
+                        "DELETE FROM state WHERE workflow = ? AND key = ?",
+                        [item for item, v in batch.items() if v is DELETED]
+                    )
+                    db.execute("COMMIT")
+                except Exception:
+                    db.execute("ROLLBACK")
+                    raise
+                # end try
+            # end with
+        except Exception:
+            # Keep the writes for the next commit, newer writes win, and cache them again as they may
+            # have been evicted while being committed
+            with self._lock:
+                for item, value in batch.items():
+                    if item not in self._dirty:
+                        self._cache[item] = MISSING if value is DELETED else value
+                    # end if
+                # end for
+                self._dirty = {**batch, **self._dirty}
+            # end with
+            raise
+        finally:
+            with self._lock:
+                self._flushing = {}
+            # end with
+        # end try
+    # end flush
+
+    # Commit loop
+    def _run(self):
+        """
+        Commit the buffered writes periodically.
+        """
+        while not self._stop.is_set():
+            self._flush_needed.wait(self.flush_interval)
+            self._flush_needed.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Cannot commit workflow state to {self.path}: {e}")
+            # end try
+        # end while
+    # end _run
+
+    # Close
+    def close(self):
+        """
+        Commit the buffered writes and close the database.
+        """
+        with self._lock:
+            self._stop.set()
+            thread = self._thread
+        # end with
+        if thread is not None:
+            self._flush_needed.set()
+            thread.join()
+        # end if
+        self.flush()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            # end if
+        # end with
+    # end close
+
+# end StateStore
+
+
+# State of a workflow
+class WorkflowState:
+    """
+    Key-value state of one workflow (self.state).
+
+    Values must be JSON serializable. Values returned by get() are shared with the cache: call set() after
+    modifying a mutable value.
+    """
+
+    def __init__(
+            self,
+            store: StateStore,
+            workflow: str
+    ):
+        """
+        Constructor.
+
+        Args:
+        - store: The state store.
+        - workflow: The name of the workflow.
+        """
+        self.store = store
+        self.workflow = workflow
+    # end __init__
+
+    def get(self, key: str, default=None):
+        """
+        Get a value, default if the key does not exist.
+        """
+        return self.store.get(self.workflow, key, default)
+    # end get
+
+    def set(self, key: str, value):
+        """
+        Set a value.
+        """
+        self.store.set(self.workflow, key, value)
+    # end set
+
+    def delete(self, key: str):
+        """
+        Delete a key.
+        """
+        self.store.delete(self.workflow, key)
+    # end delete
+
+    def compare_and_set(self, key: str, expected, value):
+        """
+        Set a value if the current one equals expected (None for a missing key), return True on success.
+        """
+        return self.store.compare_and_set(self.workflow, key, expected, value)
+    # end compare_and_set
+
+    def increment(self, key: str, amount=1):
+        """
+        Add an amount to a numeric value and return the new value.
+        """
+        return self.store.increment(self.workflow, key, amount)
+    # end increment
+
+    def __getitem__(self, key: str):
+        value = self.store.get(self.workflow, key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        # end if
+        return value
+    # end __getitem__
+
+    def __setitem__(self, key: str, value):
+        self.set(key, value)
+    # end __setitem__
+
+    def __delitem__(self, key: str):
+        self.delete(key)
+    # end __delitem__
+
+    def __contains__(self, key: str):
+        return self.store.get(self.workflow, key, MISSING) is not MISSING
+    # end __contains__
+
+# end WorkflowState
+
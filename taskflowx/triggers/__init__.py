@@ -15,9 +15,12 @@
 
 # Imports
 from .base import Trigger
+from .polling import PollingTrigger
 from .email import EmailTrigger
+from .filewatch import FileWatchTrigger
+from .http_poll import HttpPollTrigger
 from .schedule import ScheduleTrigger
 from .webhook import WebhookTrigger
 
 # Export
-__all__ = ["Trigger", "EmailTrigger", "ScheduleTrigger", "WebhookTrigger"]
+__all__ = ["Trigger", "PollingTrigger", "EmailTrigger", "FileWatchTrigger", "HttpPollTrigger", "ScheduleTrigger", "WebhookTrigger"]
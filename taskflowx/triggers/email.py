@@ -13,16 +13,15 @@
 #  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
 
 # Imports
-import time
-import threading
-import imaplib
 import email
-from imapclient import IMAPClient
-from .base import Trigger
+from concurrent.futures import wait
+from imapclient import IMAPClient, SEEN
+from .polling import PollingTrigger
 from taskflowx import logger
+from taskflowx.payload import spool
 
 
-class EmailTrigger(Trigger):
+class EmailTrigger(PollingTrigger):
     """
     Trigger to check emails and call a workflow with the email data.
     """
@@ -33,7 +32,12 @@ class EmailTrigger(Trigger):
             username: str,
             password: str,
             mailbox: str = "INBOX",
-            interval: int = 60
+            interval: int = 60,
+            min_interval: float = None,
+            max_interval: float = None,
+            backoff: float = 2.0,
+            jitter: float = 0.0,
+            cursor_file: str = None
     ):
         """
         Constructor.
@@ -44,13 +48,24 @@ class EmailTrigger(Trigger):
         - password: The password.
         - mailbox: The mailbox to check.
         - interval: The interval to check for new emails.
+        - min_interval: The interval used while new emails arrive.
+        - max_interval: The largest interval reached while the mailbox is idle.
+        - backoff: The factor applied to the interval after an empty check.
+        - jitter: The random fraction added to or removed from each interval.
+        - cursor_file: The JSON file where the UIDVALIDITY and the highest processed UID are persisted.
         """
-        super().__init__()
+        super().__init__(
+            interval=interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            jitter=jitter,
+            cursor_file=cursor_file
+        )
         self.imap_server = imap_server
         self.username = username
         self.password = password
         self.mailbox = mailbox
-        self.interval = interval
     # end __init__
 
     # Check email
@@ -61,35 +76,67 @@ class EmailTrigger(Trigger):
         """
         Check email and call the callback function with the email data.
 
+        Emails are marked as seen, and the cursor moved past them, once the workflows have finished with
+        them, so emails whose processing was interrupted are delivered again on the next check.
+
         Args:
         - callback: The callback function to call with the email data.
+
+        Returns:
+        - The number of new emails.
         """
+        count = 0
         try:
             with IMAPClient(self.imap_server) as client:
                 # Login and select mailbox
                 client.login(self.username, self.password)
-                client.select_folder(self.mailbox)
+                folder = client.select_folder(self.mailbox)
 
-                # Search for unseen messages
-                messages = client.search("UNSEEN")
-                for msgid in messages:
+                # UIDs only compare within the same UIDVALIDITY, a recreated mailbox starts over
+                uidvalidity = folder.get(b"UIDVALIDITY")
+                cursor = self.cursor if isinstance(self.cursor, dict) else {}
+                if cursor.get("uidvalidity") != uidvalidity:
+                    cursor = {"uidvalidity": uidvalidity, "last_uid": 0}
+                # end if
+
+                # Search for unseen messages above the high-water mark
+                last_uid = cursor["last_uid"]
+                if last_uid:
+                    messages = client.search(["UNSEEN", "UID", f"{last_uid + 1}:*"])
+                else:
+                    messages = client.search("UNSEEN")
+                # end if
+                dispatched = []
+                for msgid in sorted(m for m in messages if m > last_uid):
                     raw_msg = client.fetch(msgid, ["RFC822"])[msgid][b"RFC822"]
                     msg = email.message_from_bytes(raw_msg)
 
-                    # Call the workflow with the email data
-                    callback({
+                    # Large bodies are spilled to the spool directory
+                    data = {
                         "from": msg["From"],
                         "subject": msg["Subject"],
-                        "body": self.get_email_body(msg),
-                    })
+                        "body": spool.spool(self.get_email_body(msg)),
+                    }
+
+                    # Drop the raw message before running the workflows
+                    del raw_msg, msg
+
+                    # Call the workflow with the email data
+                    dispatched.append((msgid, callback(data) or []))
+                # end for
 
-                    #
-                    client.add_flags(msgid, [imaplib.SEEN])
+                # Acknowledge in UID order once processed, mark as seen and move the high-water mark
+                for msgid, futures in dispatched:
+                    wait(futures)
+                    client.add_flags(msgid, [SEEN])
+                    self.save_cursor({"uidvalidity": uidvalidity, "last_uid": msgid})
+                    count += 1
                 # end for
             # end with
         except Exception as e:
             logger.error(f"Erreur EmailTrigger: {e}")
         # end try
+        return count
     # end check_email
 
     # Get email body
@@ -111,24 +158,16 @@ class EmailTrigger(Trigger):
         return ""
     # end get_email_body
 
-    # Start
-    def start(self, callback):
+    # Poll
+    def poll(self, callback):
         """
-        Start the email trigger.
+        Check the mailbox once.
 
         Args:
         - callback: The callback function to call.
         """
-        def run():
-            while True:
-                self.check_email(callback)
-                time.sleep(self.interval)
-            # end while
-        # end run
-
-        # Start the thread
-        threading.Thread(target=run, daemon=True).start()
-    # end start
+        return self.check_email(callback)
+    # end poll
 
     # Trigger name
     @staticmethod
@@ -0,0 +1,511 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import fnmatch
+import threading
+from .base import Trigger
+from taskflowx.logger import logger
+
+
+# inotify flags
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+# Watched events
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+# inotify event header
+EVENT_HEADER = struct.Struct("iIII")
+
+
+# Load the inotify functions of the C library
+def load_inotify():
+    """
+    Load the inotify functions from the C library.
+
+    Returns:
+    - The C library, or None if inotify is not available.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    # end if
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+    # end try
+# end load_inotify
+
+
+# File watch trigger
+class FileWatchTrigger(Trigger):
+    """
+    Watch a directory and call the workflow when files are created, modified or deleted.
+
+    Uses inotify on Linux and falls back to periodic directory scans elsewhere. Rapid events on a file
+    are coalesced into one, fired only once the file has been left untouched for settle seconds.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            patterns=None,
+            ignore=None,
+            recursive: bool = False,
+            events=("created", "modified"),
+            settle: float = 1.0,
+            poll_interval: float = 5.0,
+            use_inotify: bool = True
+    ):
+        """
+        Constructor.
+
+        Args:
+        - path: The directory to watch.
+        - patterns: Glob patterns of the files to report, all files by default.
+        - ignore: Glob patterns of the files to ignore.
+        - recursive: Whether to watch subdirectories.
+        - events: The events to report, among 'created', 'modified' and 'deleted'.
+        - settle: The time in seconds a file must stay unchanged before it is reported.
+        - poll_interval: The scan interval in seconds when inotify is not available.
+        - use_inotify: Whether to use inotify when available.
+        """
+        self.path = os.path.abspath(path)
+        self.patterns = [patterns] if isinstance(patterns, str) else list(patterns or ["*"])
+        self.ignore = [ignore] if isinstance(ignore, str) else list(ignore or [])
+        self.recursive = recursive
+        self.events = set(events)
+        self.settle = settle
+        self.poll_interval = poll_interval
+        self.libc = load_inotify() if use_inotify else None
+        self._pending = {}
+        self._snapshot = None
+        self._stop = threading.Event()
+        self._wakeup = None
+        self._wakeup_lock = threading.Lock()
+    # end __init__
+
+    # Check a file name
+    def match(self, path: str):
+        """
+        Check if a file is reported.
+
+        Args:
+        - path: The path of the file.
+
+        Returns:
+        - True if the file matches the patterns and is not ignored.
+        """
+        name = os.path.basename(path)
+        relpath = os.path.relpath(path, self.path)
+        def matches(patterns):
+            return any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(relpath, p) for p in patterns)
+        # end matches
+        return matches(self.patterns) and not matches(self.ignore)
+    # end match
+
+    # File signature
+    @staticmethod
+    def signature(path: str):
+        """
+        Get the size and modification time of a file.
+
+        Args:
+        - path: The path of the file.
+
+        Returns:
+        - A (size, mtime) tuple, or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+        # end try
+    # end signature
+
+    # Record an event
+    def record(self, path: str, event: str):
+        """
+        Coalesce an event with the pending events of a file and restart its settle delay.
+
+        Args:
+        - path: The path of the file.
+        - event: The event, 'created', 'modified' or 'deleted'.
+        """
+        if not self.match(path):
+            return
+        # end if
+
+        # Coalesce with the pending event
+        previous = self._pending.get(path, (None,))[0]
+        if previous == "created" and event == "deleted":
+            # Created and removed before settling, nothing to report
+            del self._pending[path]
+            return
+        elif previous == "created" and event == "modified":
+            event = "created"
+        elif previous == "deleted" and event == "created":
+            event = "modified"
+        # end if
+
+        self._pending[path] = (event, time.monotonic() + self.settle, self.signature(path))
+    # end record
+
+    # Report settled events
+    def flush(self, callback):
+        """
+        Call the callback for the files which have settled.
+
+        Args:
+        - callback: The callback function to call.
+
+        Returns:
+        - The delay in seconds until the next pending file settles, or None.
+        """
+        now = time.monotonic()
+        next_deadline = None
+        for path, (event, deadline, signature) in list(self._pending.items()):
+            if deadline > now:
+                next_deadline = deadline if next_deadline is None else min(next_deadline, deadline)
+                continue
+            # end if
+
+            # Still being written, wait for another settle delay
+            current = self.signature(path)
+            if event != "deleted" and current != signature:
+                self._pending[path] = (event, now + self.settle, current)
+                next_deadline = now + self.settle if next_deadline is None else min(next_deadline, now + self.settle)
+                continue
+            # end if
+
+            del self._pending[path]
+
+            # Keep the snapshot of inotify watches in sync with what was reported
+            if self._snapshot is not None:
+                if event == "deleted":
+                    self._snapshot.pop(path, None)
+                else:
+                    self._snapshot[path] = current
+                # end if
+            # end if
+
+            if event in self.events:
+                try:
+                    callback({"path": path, "event": event})
+                except Exception as e:
+                    logger.error(f"Error in FileWatchTrigger callback for {path}: {e}")
+                # end try
+            # end if
+        # end for
+
+        return None if next_deadline is None else max(next_deadline - now, 0.0)
+    # end flush
+
+    # Watch with inotify
+    def run_inotify(self, callback):
+        """
+        Watch the directory with inotify.
+
+        Args:
+        - callback: The callback function to call.
+        """
+        fd = self.libc.inotify_init1(IN_CLOEXEC | IN_NONBLOCK)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # end if
+        watches = {}
+
+        # Pipe used by stop() to interrupt the wait
+        with self._wakeup_lock:
+            wakeup_read, self._wakeup = os.pipe()
+        # end with
+
+        # Add a watch on a directory
+        def add_watch(directory):
+            wd = self.libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                logger.error(f"Cannot watch {directory}: {os.strerror(error)}")
+                return error
+            # end if
+            watches[wd] = directory
+            return 0
+        # end add_watch
+
+        try:
+            # Watch the tree, only directories are visited
+            error = add_watch(self.path)
+            if error:
+                raise OSError(error, f"cannot watch {self.path}")
+            # end if
+            root_wd = next(iter(watches))
+            if self.recursive:
+                for root, dirs, _ in os.walk(self.path):
+                    for d in dirs:
+                        add_watch(os.path.join(root, d))
+                    # end for
+                # end for
+            # end if
+
+            # Files as of now, compared with a rescan when the event queue overflows
+            self._snapshot = self.scan()
+
+            while not self._stop.is_set():
+                # Sleep until an event arrives or a pending file settles, forever when idle
+                timeout = self.flush(callback)
+                ready, _, _ = select.select([fd, wakeup_read], [], [], timeout)
+                if fd not in ready:
+                    continue
+                # end if
+
+                # Read the events
+                try:
+                    buffer = os.read(fd, 64 * 1024)
+                except OSError as e:
+                    if e.errno == errno.EAGAIN:
+                        continue
+                    # end if
+                    raise
+                # end try
+
+                # Decode the events
+                offset = 0
+                while offset < len(buffer):
+                    wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+                    offset += EVENT_HEADER.size
+                    name = os.fsdecode(buffer[offset:offset + length].rstrip(b"\0"))
+                    offset += length
+
+                    # Queue overflow, events were lost
+                    if mask & IN_Q_OVERFLOW:
+                        logger.warning(f"FileWatchTrigger: event queue overflow on {self.path}, rescanning")
+                        if self.recursive:
+                            # Directories created while events were dropped
+                            watched = set(watches.values())
+                            for root, dirs, _ in os.walk(self.path):
+                                for d in dirs:
+                                    if os.path.join(root, d) not in watched:
+                                        add_watch(os.path.join(root, d))
+                                    # end if
+                                # end for
+                            # end for
+                        # end if
+                        self._snapshot = self.compare(self._snapshot)
+                        continue
+                    # end if
+
+                    # Removed watch
+                    directory = watches.get(wd)
+                    if directory is None or mask & IN_IGNORED:
+                        watches.pop(wd, None)
+                        if wd == root_wd:
+                            raise OSError(errno.ENOENT, f"{self.path} is no longer watched")
+                        # end if
+                        continue
+                    # end if
+                    path = os.path.join(directory, name)
+
+                    # Directories
+                    if mask & IN_ISDIR:
+                        if self.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                            add_watch(path)
+                            # Files written before the watch was added
+                            for root, dirs, files in os.walk(path):
+                                for d in dirs:
+                                    add_watch(os.path.join(root, d))
+                                # end for
+                                for f in files:
+                                    self.record(os.path.join(root, f), "created")
+                                # end for
+                            # end for
+                        # end if
+                        continue
+                    # end if
+
+                    # Files
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self.record(path, "created")
+                    elif mask & (IN_MODIFY | IN_CLOSE_WRITE):
+                        self.record(path, "modified")
+                    elif mask & (IN_DELETE | IN_MOVED_FROM):
+                        self.record(path, "deleted")
+                    # end if
+                # end while
+            # end while
+        finally:
+            self._snapshot = None
+            os.close(fd)
+            os.close(wakeup_read)
+            with self._wakeup_lock:
+                os.close(self._wakeup)
+                self._wakeup = None
+            # end with
+        # end try
+    # end run_inotify
+
+    # Scan the directory
+    def scan(self):
+        """
+        Scan the directory.
+
+        Returns:
+        - A dictionary of file signatures by path.
+        """
+        snapshot = {}
+        directories = [self.path]
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                directories.append(entry.path)
+                            # end if
+                        elif self.match(entry.path):
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                        # end if
+                    # end for
+                # end with
+            except OSError:
+                pass
+            # end try
+        # end while
+        return snapshot
+    # end scan
+
+    # Compare with a previous scan
+    def compare(self, snapshot: dict):
+        """
+        Scan the directory and record the differences with a previous scan.
+
+        Args:
+        - snapshot: The previous scan.
+
+        Returns:
+        - The new scan.
+        """
+        current = self.scan()
+        for path, signature in current.items():
+            if path not in snapshot:
+                self.record(path, "created")
+            elif snapshot[path] != signature:
+                self.record(path, "modified")
+            # end if
+        # end for
+        for path in snapshot.keys() - current.keys():
+            self.record(path, "deleted")
+        # end for
+        return current
+    # end compare
+
+    # Watch with periodic scans
+    def run_polling(self, callback):
+        """
+        Watch the directory by comparing periodic scans.
+
+        Args:
+        - callback: The callback function to call.
+        """
+        snapshot = self.scan()
+        next_scan = time.monotonic() + self.poll_interval
+        while not self._stop.is_set():
+            # Compare with the previous scan
+            if time.monotonic() >= next_scan:
+                snapshot = self.compare(snapshot)
+                next_scan = time.monotonic() + self.poll_interval
+            # end if
+
+            # Sleep until the next scan or the next settled file
+            timeout = self.flush(callback)
+            delay = max(next_scan - time.monotonic(), 0.0)
+            self._stop.wait(delay if timeout is None else min(timeout, delay))
+        # end while
+    # end run_polling
+
+    # Start
+    def start(self, callback):
+        """
+        Start watching the directory in a background thread.
+
+        Args:
+        - callback: The callback function to call.
+        """
+        def run():
+            if self.libc is not None:
+                try:
+                    self.run_inotify(callback)
+                    return
+                except OSError as e:
+                    if self._stop.is_set():
+                        return
+                    # end if
+                    logger.error(f"FileWatchTrigger: inotify unavailable ({e}), falling back to polling")
+                # end try
+            # end if
+            self.run_polling(callback)
+        # end run
+
+        # Start the thread
+        threading.Thread(target=run, daemon=True).start()
+    # end start
+
+    # Stop
+    def stop(self):
+        """
+        Stop watching the directory.
+        """
+        self._stop.set()
+        with self._wakeup_lock:
+            if self._wakeup is not None:
+                os.write(self._wakeup, b"\0")
+            # end if
+        # end with
+    # end stop
+
+    # Trigger name
+    @staticmethod
+    def trigger_name():
+        """
+        Get the trigger name.
+        """
+        return "filewatch"
+    # end trigger_name
+
+# end FileWatchTrigger
+
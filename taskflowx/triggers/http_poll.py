@@ -0,0 +1,140 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import hashlib
+from .polling import PollingTrigger
+from taskflowx.logger import logger
+from taskflowx.payload import spool
+from taskflowx.httpclient import default_pool
+
+
+# HTTP polling trigger
+class HttpPollTrigger(PollingTrigger):
+    """
+    Poll a URL with conditional requests and call the workflow when its content changes.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            interval: float = 60,
+            headers: dict = None,
+            timeout: float = 30,
+            min_interval: float = None,
+            max_interval: float = None,
+            backoff: float = 2.0,
+            jitter: float = 0.1,
+            cursor_file: str = None
+    ):
+        """
+        Constructor.
+
+        Args:
+        - url: The URL to poll.
+        - interval: The polling interval in seconds.
+        - headers: Additional request headers.
+        - timeout: The request timeout in seconds.
+        - min_interval: The interval used while the content changes.
+        - max_interval: The largest interval reached while the content is unchanged.
+        - backoff: The factor applied to the interval after an unchanged poll.
+        - jitter: The random fraction added to or removed from each interval.
+        - cursor_file: The JSON file where the validators (ETag, Last-Modified) are persisted.
+        """
+        super().__init__(
+            interval=interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            jitter=jitter,
+            cursor_file=cursor_file
+        )
+        self.url = url
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.cursor = self.cursor or {}
+    # end __init__
+
+    # Poll the URL
+    def poll(self, callback):
+        """
+        Send a conditional request and call the callback if the content changed.
+
+        Args:
+        - callback: The callback function to call.
+
+        Returns:
+        - True if the content changed.
+        """
+        # Conditional request
+        headers = dict(self.headers)
+        if self.cursor.get("etag"):
+            headers["If-None-Match"] = self.cursor["etag"]
+        # end if
+        if self.cursor.get("last_modified"):
+            headers["If-Modified-Since"] = self.cursor["last_modified"]
+        # end if
+
+        response = default_pool.request("GET", self.url, headers=headers, timeout=self.timeout)
+
+        # Not modified
+        if response.status == 304:
+            return False
+        # end if
+
+        # Error
+        if response.status >= 400:
+            logger.error(f"HttpPollTrigger: {self.url} returned {response.status} {response.reason}")
+            return False
+        # end if
+
+        # Persist the validators, they may change while the content does not
+        digest = hashlib.sha1(response.body).hexdigest()
+        unchanged = digest == self.cursor.get("digest")
+        cursor = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "digest": digest
+        }
+        if cursor != self.cursor:
+            self.save_cursor(cursor)
+        # end if
+
+        # Servers without validators: compare the content digest
+        if unchanged:
+            return False
+        # end if
+
+        # Call the workflow with the response
+        callback({
+            "url": self.url,
+            "status": response.status,
+            "content_type": response.headers.get("Content-Type"),
+            "body": spool.spool(response.body),
+        })
+
+        return True
+    # end poll
+
+    # Trigger name
+    @staticmethod
+    def trigger_name():
+        """
+        Get the trigger name.
+        """
+        return "http_poll"
+    # end trigger_name
+
+# end HttpPollTrigger
+
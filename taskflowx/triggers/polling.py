@@ -0,0 +1,182 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import os
+import json
+import random
+import threading
+from abc import abstractmethod
+from .base import Trigger
+from taskflowx.logger import logger
+
+
+# Polling trigger
+class PollingTrigger(Trigger):
+    """
+    Base class for triggers polling a source at regular intervals.
+
+    The interval adapts to the source: it drops to min_interval as soon as a poll finds new data
+    and grows by a factor backoff after each empty poll, up to max_interval. A cursor (high-water mark)
+    can be persisted to a JSON file to resume where the trigger stopped.
+    """
+
+    def __init__(
+            self,
+            interval: float = 60,
+            min_interval: float = None,
+            max_interval: float = None,
+            backoff: float = 2.0,
+            jitter: float = 0.0,
+            cursor_file: str = None
+    ):
+        """
+        Constructor.
+
+        Args:
+        - interval: The initial polling interval in seconds.
+        - min_interval: The interval used while polls find new data, defaults to interval.
+        - max_interval: The largest interval reached when idle, defaults to interval.
+        - backoff: The factor applied to the interval after an empty poll.
+        - jitter: The random fraction (0 to 1) added to or removed from each interval.
+        - cursor_file: The JSON file where the cursor is persisted.
+        """
+        self.interval = interval
+        self.min_interval = min_interval if min_interval is not None else interval
+        self.max_interval = max_interval if max_interval is not None else max(interval, self.min_interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.cursor_file = cursor_file
+        self.cursor = self.load_cursor()
+        self._stop = threading.Event()
+    # end __init__
+
+    # Poll the source
+    @abstractmethod
+    def poll(self, callback):
+        """
+        Must be implemented to poll the source once and call the callback for each new item.
+
+        Args:
+        - callback: The callback function to call.
+
+        Returns:
+        - The number of new items found (or a boolean).
+        """
+        pass
+    # end poll
+
+    # Load the cursor
+    def load_cursor(self):
+        """
+        Load the persisted cursor.
+
+        Returns:
+        - The cursor, or None.
+        """
+        if not self.cursor_file or not os.path.exists(self.cursor_file):
+            return None
+        # end if
+        try:
+            with open(self.cursor_file, "r") as f:
+                return json.load(f)
+            # end with
+        except (OSError, ValueError) as e:
+            logger.error(f"Cannot load cursor {self.cursor_file}: {e}")
+            return None
+        # end try
+    # end load_cursor
+
+    # Save the cursor
+    def save_cursor(self, cursor):
+        """
+        Update and persist the cursor.
+
+        Args:
+        - cursor: The new cursor, JSON serializable.
+        """
+        self.cursor = cursor
+        if not self.cursor_file:
+            return
+        # end if
+
+        # Write atomically
+        tmp_file = f"{self.cursor_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(cursor, f)
+        # end with
+        os.replace(tmp_file, self.cursor_file)
+    # end save_cursor
+
+    # Next interval
+    def next_interval(self, found):
+        """
+        Compute the interval before the next poll.
+
+        Args:
+        - found: The result of the last poll.
+
+        Returns:
+        - The delay in seconds.
+        """
+        # Poll faster while there is new data, back off when idle
+        if found:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        # end if
+
+        # Spread polls of concurrent triggers
+        delay = self.interval
+        if self.jitter:
+            delay *= 1.0 + random.uniform(-self.jitter, self.jitter)
+        # end if
+
+        return max(delay, 0.0)
+    # end next_interval
+
+    # Start
+    def start(self, callback):
+        """
+        Start polling in a background thread.
+
+        Args:
+        - callback: The callback function to call.
+        """
+        def run():
+            while not self._stop.is_set():
+                try:
+                    found = self.poll(callback)
+                except Exception as e:
+                    logger.error(f"Error in {self.__class__.__name__}: {e}")
+                    found = False
+                # end try
+                self._stop.wait(self.next_interval(found))
+            # end while
+        # end run
+
+        # Start the thread
+        threading.Thread(target=run, daemon=True).start()
+    # end start
+
+    # Stop
+    def stop(self):
+        """
+        Stop polling.
+        """
+        self._stop.set()
+    # end stop
+
+# end PollingTrigger
+
@@ -13,13 +13,11 @@
 #  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
 
 # Imports
-import time
-import threading
-from .base import Trigger
+from .polling import PollingTrigger
 
 
 # Schedule trigger
-class ScheduleTrigger(Trigger):
+class ScheduleTrigger(PollingTrigger):
     """
     Schedule trigger.
     """
@@ -27,37 +25,30 @@ class ScheduleTrigger(Trigger):
     # Constructor
     def __init__(
             self,
-            interval: int
+            interval: int,
+            jitter: float = 0.0
     ):
         """
         Constructor.
 
         Args:
         - interval: The interval to trigger the callback.
+        - jitter: The random fraction added to or removed from each interval.
         """
-        self.params = {
-            "interval": interval
-        }
+        super().__init__(interval=interval, jitter=jitter)
     # end __init__
 
     # Pull the trigger
-    def start(self, callback):
+    def poll(self, callback):
         """
-        Start the schedule trigger.
+        Call the callback.
 
         Args:
         - callback: The callback function to call.
         """
-        def run():
-            while True:
-                callback()
-                time.sleep(self.params["interval"])
-            # end while
-        # end run
-
-        # Start the thread
-        threading.Thread(target=run, daemon=True).start()
-    # end start
+        callback()
+        return True
+    # end poll
 
     @staticmethod
     def trigger_name():
@@ -68,4 +59,3 @@ class ScheduleTrigger(Trigger):
     # end trigger_name
 
 # end ScheduleTrigger
-
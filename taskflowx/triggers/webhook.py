@@ -15,6 +15,7 @@
 # Imports
 from flask import Flask, request
 from .base import Trigger
+from taskflowx.payload import spool
 import threading
 
 
@@ -55,7 +56,12 @@ class WebhookTrigger(Trigger):
         # Handle webhook
         @app.route(self.params["path"], methods=["POST"])
         def handle_webhook():
-            callback(request.json)
+            # Large bodies are streamed to the spool directory without being parsed
+            if request.content_length is not None and request.content_length > spool.threshold:
+                callback(spool.spool_stream(request.stream))
+            else:
+                callback(request.json)
+            # end if
             return {"status": "ok"}
         # end handle_webhook
 
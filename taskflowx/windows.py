@@ -0,0 +1,485 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import math
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+# Window kinds
+WINDOW_KINDS = ("tumbling", "sliding", "session")
+
+
+# Count aggregator
+class Count:
+    """
+    Number of events.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+    # end __init__
+
+    def add(self, value):
+        self.value += 1
+    # end add
+
+    def merge(self, other):
+        self.value += other.value
+    # end merge
+
+    def result(self):
+        return self.value
+    # end result
+
+# end Count
+
+
+# Sum aggregator
+class Sum:
+    """
+    Sum of a field, missing values are ignored.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+    # end __init__
+
+    def add(self, value):
+        if value is not None:
+            self.value += value
+        # end if
+    # end add
+
+    def merge(self, other):
+        self.value += other.value
+    # end merge
+
+    def result(self):
+        return self.value
+    # end result
+
+# end Sum
+
+
+# Minimum aggregator
+class Min:
+    """
+    Minimum of a field, missing values are ignored.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = None
+    # end __init__
+
+    def add(self, value):
+        if value is not None and (self.value is None or value < self.value):
+            self.value = value
+        # end if
+    # end add
+
+    def merge(self, other):
+        self.add(other.value)
+    # end merge
+
+    def result(self):
+        return self.value
+    # end result
+
+# end Min
+
+
+# Maximum aggregator
+class Max(Min):
+    """
+    Maximum of a field, missing values are ignored.
+    """
+
+    __slots__ = ()
+
+    def add(self, value):
+        if value is not None and (self.value is None or value > self.value):
+            self.value = value
+        # end if
+    # end add
+
+# end Max
+
+
+# Approximate distinct count
+class Distinct:
+    """
+    Approximate number of distinct values of a field (HyperLogLog), in 2^precision bytes.
+    """
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 10):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+    # end __init__
+
+    def add(self, value):
+        if value is None:
+            return
+        # end if
+        h = int.from_bytes(hashlib.blake2b(str(value).encode(), digest_size=8).digest(), "big")
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+        # end if
+    # end add
+
+    def merge(self, other):
+        self.registers = bytearray(map(max, self.registers, other.registers))
+    # end merge
+
+    def result(self):
+        m = len(self.registers)
+        estimate = (0.7213 / (1 + 1.079 / m)) * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        # Linear counting for small cardinalities
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        # end if
+        return round(estimate)
+    # end result
+
+# end Distinct
+
+
+# Aggregators
+AGGREGATORS = {
+    "count": Count,
+    "sum": Sum,
+    "min": Min,
+    "max": Max,
+    "distinct": Distinct
+}
+
+
+# Field getter
+def field_getter(field):
+    """
+    Build a function reading a field of an event.
+
+    Args:
+    - field: A key of dictionary events (attribute of other events), a callable, or None.
+
+    Returns:
+    - A function taking an event.
+    """
+    if field is None:
+        return lambda event: None
+    elif callable(field):
+        return field
+    # end if
+    def get(event):
+        if isinstance(event, dict):
+            return event.get(field)
+        # end if
+        return getattr(event, field, None)
+    # end get
+    return get
+# end field_getter
+
+
+# Windowed aggregation
+class WindowedAggregation:
+    """
+    Group events by key and window and aggregate them incrementally.
+
+    Tumbling and sliding windows keep, per key, one pane of slide seconds per active slide and merge
+    the panes when a window closes, so an event is aggregated once whatever the overlap. Session
+    windows close after gap seconds without events for their key. The number of keys held in memory
+    is bounded by max_keys: the least recently updated key is emitted early when the bound is reached.
+    """
+
+    def __init__(
+            self,
+            kind: str = "tumbling",
+            size: float = 60,
+            slide: float = None,
+            gap: float = None,
+            key=None,
+            aggregations: dict = None,
+            where=None,
+            time_field=None,
+            lateness: float = 0,
+            max_keys: int = 10000,
+            precision: int = 10
+    ):
+        """
+        Constructor.
+
+        Args:
+        - kind: The window kind, 'tumbling', 'sliding' or 'session'.
+        - size: The window length in seconds (tumbling, sliding).
+        - slide: The interval between sliding windows, must divide size.
+        - gap: The inactivity in seconds closing a session.
+        - key: The field (or callable) grouping events, None for a single group.
+        - aggregations: The results by name: 'count', or (aggregator, field) with aggregator in sum, min, max, distinct.
+        - where: A predicate selecting the events to aggregate.
+        - time_field: The field holding the event time (epoch seconds), the arrival time if None.
+        - lateness: The extra delay in seconds before a window closes, to wait for late events.
+        - max_keys: The maximum number of keys held in memory.
+        - precision: The HyperLogLog precision of distinct counts.
+        """
+        if kind not in WINDOW_KINDS:
+            raise ValueError(f"Unknown window kind: {kind}")
+        # end if
+        if kind == "session" and not gap:
+            raise ValueError("Session windows need a gap")
+        # end if
+        if kind == "tumbling":
+            slide = size
+        elif kind == "sliding":
+            slide = slide or size
+            if not math.isclose(size / slide, round(size / slide)):
+                raise ValueError("The slide of a sliding window must divide its size")
+            # end if
+        # end if
+        self.kind = kind
+        self.size = size
+        self.slide = slide
+        self.gap = gap
+        self.key = field_getter(key)
+        self.where = where
+        self.time_field = field_getter(time_field) if time_field is not None else None
+        self.lateness = lateness
+        self.max_keys = max_keys
+        self.precision = precision
+        self.late = 0
+
+        # Aggregations
+        self.aggregations = []
+        for name, spec in (aggregations or {"count": "count"}).items():
+            aggregator, field = (spec, None) if isinstance(spec, str) else spec
+            if aggregator not in AGGREGATORS:
+                raise ValueError(f"Unknown aggregation: {aggregator}")
+            # end if
+            self.aggregations.append((name, aggregator, field_getter(field)))
+        # end for
+
+        # State by key: panes by start time, or [start, last event, aggregators] for sessions
+        self._state = OrderedDict()
+        self._next_end = None
+        self._lock = threading.Lock()
+    # end __init__
+
+    # New aggregators
+    def _new_aggregators(self):
+        """
+        Create one aggregator per aggregation.
+        """
+        return [
+            AGGREGATORS[aggregator](self.precision) if aggregator == "distinct" else AGGREGATORS[aggregator]()
+            for _, aggregator, _ in self.aggregations
+        ]
+    # end _new_aggregators
+
+    # Window result
+    def _result(self, key, start, end, aggregators, partial=False):
+        """
+        Build the result of a window.
+        """
+        result = {"key": key, "start": start, "end": end}
+        for (name, _, _), aggregator in zip(self.aggregations, aggregators):
+            result[name] = aggregator.result()
+        # end for
+        if partial:
+            result["partial"] = True
+        # end if
+        return result
+    # end _result
+
+    # Merge panes
+    def _merge(self, panes):
+        """
+        Merge the aggregators of several panes.
+        """
+        merged = self._new_aggregators()
+        for aggregators in panes:
+            for target, source in zip(merged, aggregators):
+                target.merge(source)
+            # end for
+        # end for
+        return merged
+    # end _merge
+
+    # Add an event
+    def add(self, event, now: float = None):
+        """
+        Aggregate an event.
+
+        Args:
+        - event: The event.
+        - now: The current time, time.time() if None.
+
+        Returns:
+        - The results of the windows emitted early to respect max_keys.
+        """
+        if self.where is not None and not self.where(event):
+            return []
+        # end if
+        now = time.time() if now is None else now
+        ts = self.time_field(event) if self.time_field is not None else now
+        key = self.key(event)
+        values = [getter(event) for _, _, getter in self.aggregations]
+        evicted = []
+
+        with self._lock:
+            # Bound the number of keys, least recently updated first
+            if key not in self._state and len(self._state) >= self.max_keys:
+                old_key, old_state = self._state.popitem(last=False)
+                evicted.append(self._flush_key(old_key, old_state))
+            # end if
+
+            if self.kind == "session":
+                session = self._state.get(key)
+                if session is not None and ts >= session[1] + self.gap:
+                    # Closed by the gap but not yet expired
+                    evicted.append(self._result(key, session[0], session[1] + self.gap, session[2]))
+                    session = None
+                # end if
+                if session is None:
+                    session = [ts, ts, self._new_aggregators()]
+                    self._state[key] = session
+                # end if
+                session[0] = min(session[0], ts)
+                session[1] = max(session[1], ts)
+                aggregators = session[2]
+            else:
+                pane_start = math.floor(ts / self.slide) * self.slide
+                if self._next_end is None:
+                    self._next_end = pane_start + self.slide
+                # end if
+
+                # The windows of the pane are already closed
+                if pane_start + self.size < self._next_end:
+                    self.late += 1
+                    return evicted
+                # end if
+
+                panes = self._state.setdefault(key, {})
+                aggregators = panes.get(pane_start)
+                if aggregators is None:
+                    aggregators = panes[pane_start] = self._new_aggregators()
+                # end if
+            # end if
+
+            for aggregator, value in zip(aggregators, values):
+                aggregator.add(value)
+            # end for
+            self._state.move_to_end(key)
+        # end with
+
+        return [result for result in evicted if result is not None]
+    # end add
+
+    # Flush a key
+    def _flush_key(self, key, state):
+        """
+        Emit the open window of an evicted key as a partial result.
+        """
+        if self.kind == "session":
+            return self._result(key, state[0], state[1] + self.gap, state[2], partial=True)
+        # end if
+        if not state:
+            return None
+        # end if
+        start = min(state)
+        return self._result(key, start, max(state) + self.slide, self._merge(state.values()), partial=True)
+    # end _flush_key
+
+    # Close windows
+    def expire(self, now: float = None):
+        """
+        Close the windows which ended.
+
+        Args:
+        - now: The current time, time.time() if None. math.inf closes every window.
+
+        Returns:
+        - The results of the closed windows.
+        """
+        now = time.time() if now is None else now
+        results = []
+        with self._lock:
+            # Sessions
+            if self.kind == "session":
+                for key, (start, last, aggregators) in list(self._state.items()):
+                    if last + self.gap + self.lateness <= now:
+                        results.append(self._result(key, start, last + self.gap, aggregators))
+                        del self._state[key]
+                    # end if
+                # end for
+                return results
+            # end if
+
+            # Tumbling and sliding windows
+            while self._next_end is not None and self._next_end + self.lateness <= now:
+                end = self._next_end
+                if not self._state:
+                    self._next_end = None
+                    break
+                # end if
+                for key, panes in list(self._state.items()):
+                    window = [aggregators for start, aggregators in panes.items() if end - self.size <= start < end]
+                    if window:
+                        results.append(self._result(key, end - self.size, end, self._merge(window)))
+                    # end if
+
+                    # Drop the panes of no later window
+                    for start in [start for start in panes if start + self.size <= end]:
+                        del panes[start]
+                    # end for
+                    if not panes:
+                        del self._state[key]
+                    # end if
+                # end for
+
+                # Skip the empty windows
+                next_end = end + self.slide
+                if self._state:
+                    first = min(min(panes) for panes in self._state.values()) + self.slide
+                    next_end = max(next_end, first)
+                # end if
+                self._next_end = next_end
+            # end while
+        # end with
+        return results
+    # end expire
+
+    # Number of keys
+    def __len__(self):
+        """
+        Number of keys held in memory.
+        """
+        return len(self._state)
+    # end __len__
+
+# end WindowedAggregation
+
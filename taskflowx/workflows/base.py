@@ -13,16 +13,89 @@
 #  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
 
 # Imports
+import threading
+from contextlib import ExitStack
 from taskflowx import logger
+from taskflowx.profiling import active_session
 
 
 class Workflow:
-    def run(self, **kwargs):
-        logger.info(f"Exécution du workflow {self.__class__.__name__}")
+    # Priority lane (realtime, normal, bulk), None to use the lane of the trigger
+    priority = None
+
+    # Shared resources (ResourceRegistry), durable state (WorkflowState) and per-worker state, set by open()
+    resources = None
+    state = None
+    worker = None
+
+    def open(self, resources=None, state=None):
+        self.resources = resources
+        self.state = state
+        self.worker = threading.local()
+        self.setup()
+
+    def close(self):
+        self.teardown()
+
+    def setup(self):
+        """
+        Appelé une fois au démarrage, avant le premier événement.
+        """
+        pass
+
+    def setup_worker(self):
+        """
+        Appelé une fois par thread worker, avant le premier événement traité par ce thread.
+        """
+        pass
+
+    def teardown(self):
+        """
+        Appelé une fois à l'arrêt.
+        """
+        pass
+
+    def handlers(self, trigger, windowed=False):
+        # Windowed handlers receive window results instead of events
+        handlers = []
         for method in dir(self):
             func = getattr(self, method)
-            if hasattr(func, "_trigger"):
-                func(**kwargs)
+            if getattr(func, "_trigger", None) == trigger and hasattr(func, "_window") == windowed:
+                handlers.append(func)
+        return handlers
+
+    def run(self, trigger, *args, **kwargs):
+        return self.execute(self.run_handlers, trigger, *args, **kwargs)
+
+    def run_window(self, handler, result):
+        return self.execute(self.call_handler, getattr(self, handler), result)
+
+    def execute(self, func, *args, **kwargs):
+        # Per-worker initialization
+        if self.worker is not None and not getattr(self.worker, "ready", False):
+            self.setup_worker()
+            self.worker.ready = True
+
+        # Profile the execution when requested from the control socket
+        session = active_session(self.__class__.__name__)
+        if session is not None:
+            return session.profile(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    def run_handlers(self, trigger, *args, **kwargs):
+        logger.info(f"Exécution du workflow {self.__class__.__name__}")
+        for func in self.handlers(trigger):
+            self.call_handler(func, *args, **kwargs)
+
+    def call_handler(self, func, *args, **kwargs):
+        names = getattr(func, "_resources", ())
+        if not names:
+            return func(*args, **kwargs)
+
+        # Inject the declared resources
+        with ExitStack() as stack:
+            leased = {name: stack.enter_context(self.resources.lease(name)) for name in names}
+            return func(*args, **kwargs, **leased)
 
 
 def trigger(type):
@@ -36,3 +109,27 @@ def trigger(type):
 
     return decorator
 
+
+def uses(*names):
+    """
+    Décorateur pour injecter des ressources partagées dans un handler, passées par nom.
+    """
+
+    def decorator(func):
+        func._resources = names
+        return func
+
+    return decorator
+
+
+def window(kind="tumbling", **options):
+    """
+    Décorateur pour agréger les événements d'un trigger par fenêtre (voir WindowedAggregation).
+    Le handler reçoit le résultat de chaque fenêtre fermée au lieu de chaque événement.
+    """
+
+    def decorator(func):
+        func._window = dict(kind=kind, **options)
+        return func
+
+    return decorator
@@ -0,0 +1,256 @@
+#  ████████╗ █████╗ ███████╗██╗  ███████╗██╗      ██████╗ ██╗  ██╗
+#  ╚══██╔══╝██╔══██╗██╔════╝██║  ██╔════╝██║     ██╔═══██╗██║  ██║
+#     ██║   ███████║███████╗██║  █████╗  ██║     ██║   ██║███████║
+#     ██║   ██╔══██║╚════██║██║  ██╔══╝  ██║     ██║   ██║██╔══██║
+#     ██║   ██║  ██║███████║██║  ██║     ███████╗╚██████╔╝██║  ██║
+#     ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝     ╚══════╝ ╚═════╝ ╚═╝  ╚═╝
+#
+#  TaskFlowX - A lightweight and modular workflow automation engine
+#
+#  This code is licensed under the GNU General Public License (GPL).
+#  You are free to modify and distribute it under the terms of the GPL.
+#
+#  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
+
+# Imports
+import time
+import socket
+import smtplib
+import unittest
+import threading
+import socketserver
+from taskflowx.actions.email import EmailAction
+
+
+# SMTP server stub
+class SMTPStub(socketserver.ThreadingTCPServer):
+    """
+    Minimal SMTP server recording the messages it accepts.
+
+    With pipelining, the replies to MAIL and RCPT are held back until DATA, as RFC 2920 allows, so a
+    client waiting for each reply before sending the next command never gets an answer.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, pipelining: bool = True, temporary_failures: int = 0):
+        """
+        Constructor.
+
+        Args:
+        - pipelining: Whether to advertise PIPELINING.
+        - temporary_failures: The number of times recipients at 'later@' are refused with a 4xx code.
+        """
+        super().__init__(("127.0.0.1", 0), SMTPStubHandler)
+        self.pipelining = pipelining
+        self.temporary_failures = temporary_failures
+        self.messages = []
+        self.raw_lines = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+    # end __init__
+
+    # Port
+    @property
+    def port(self):
+        return self.server_address[1]
+    # end port
+
+    # Refuse a recipient
+    def refuse(self, recipient: str):
+        """
+        Get the error reply for a recipient, or None if it is accepted.
+
+        Args:
+        - recipient: The RCPT command.
+        """
+        if "bad@" in recipient:
+            return "550 no such user"
+        # end if
+        if "later@" in recipient:
+            with self._lock:
+                if self.temporary_failures:
+                    self.temporary_failures -= 1
+                    return "451 try again later"
+                # end if
+            # end with
+        # end if
+        return None
+    # end refuse
+
+    # Stop
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+    # end stop
+
+# end SMTPStub
+
+
+# SMTP session of the stub
+class SMTPStubHandler(socketserver.StreamRequestHandler):
+    """
+    One SMTP session.
+    """
+
+    def reply(self, *lines):
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+        self.wfile.flush()
+    # end reply
+
+    def handle(self):
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        server = self.server
+        self.reply("220 stub")
+        held, sender, recipients = [], None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            # end if
+            command = line.decode().strip()
+            verb = command.upper()
+            if verb.startswith("EHLO"):
+                self.reply("250-stub", *(["250-PIPELINING"] if server.pipelining else []), "250 AUTH PLAIN")
+            elif verb.startswith("AUTH"):
+                self.reply("235 ok")
+            elif verb.startswith("MAIL") or verb.startswith("RCPT"):
+                if verb.startswith("MAIL"):
+                    sender, recipients, response = command[10:].strip("<>"), [], "250 ok"
+                else:
+                    response = server.refuse(command)
+                    if response is None:
+                        recipients.append(command[8:].strip("<>"))
+                        response = "250 ok"
+                    # end if
+                # end if
+                if server.pipelining:
+                    held.append(response)
+                else:
+                    self.reply(response)
+                # end if
+            elif verb == "DATA":
+                responses, held = held, []
+                if not recipients:
+                    self.reply(*responses, "554 no valid recipients")
+                    continue
+                # end if
+                self.reply(*responses, "354 go ahead")
+
+                # Content, dot-stuffed
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if line == b".\r\n" or not line:
+                        break
+                    # end if
+                    server.raw_lines.append(line)
+                    lines.append(line[1:] if line.startswith(b".") else line)
+                # end while
+                server.messages.append((sender, recipients, b"".join(lines)))
+                self.reply("250 queued")
+            elif verb in ("RSET", "NOOP"):
+                held = []
+                self.reply("250 ok")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("500 unknown command")
+            # end if
+        # end while
+    # end handle
+
+# end SMTPStubHandler
+
+
+# Email action
+class EmailActionTest(unittest.TestCase):
+    """
+    EmailAction against the SMTP stub.
+    """
+
+    def start(self, pipelining: bool = True, temporary_failures: int = 0, **settings):
+        """
+        Start a stub and an EmailAction connected to it.
+        """
+        server = SMTPStub(pipelining=pipelining, temporary_failures=temporary_failures)
+        self.addCleanup(server.stop)
+        settings.setdefault("connections", 2)
+        action = EmailAction(host="127.0.0.1", port=server.port, username="user", password="secret", **settings)
+        self.addCleanup(action.close, 1)
+        return server, action
+    # end start
+
+    def test_pipelining(self):
+        server, action = self.start(pipelining=True)
+        futures = [action.send(to=f"user{i}@example.com", subject=f"Message {i}", body=f"Body {i}") for i in range(20)]
+        for future in futures:
+            self.assertEqual(future.result(timeout=5), {})
+        # end for
+        self.assertEqual(len(server.messages), 20)
+        self.assertEqual(action.stats()["sent"], 20)
+    # end test_pipelining
+
+    def test_without_pipelining(self):
+        server, action = self.start(pipelining=False)
+        futures = [action.send(to=f"user{i}@example.com", subject=f"Message {i}", body=f"Body {i}") for i in range(5)]
+        for future in futures:
+            self.assertEqual(future.result(timeout=5), {})
+        # end for
+        self.assertEqual(len(server.messages), 5)
+    # end test_without_pipelining
+
+    def test_dot_stuffing(self):
+        for pipelining in (True, False):
+            server, action = self.start(pipelining=pipelining)
+            action.send(to="user@example.com", subject="Dots", body=".hidden\n..two\nlast").result(timeout=5)
+            self.assertIn(b"..hidden\r\n", server.raw_lines)
+            self.assertIn(b"...two\r\n", server.raw_lines)
+            self.assertIn(b"\r\n.hidden\r\n..two\r\nlast\r\n", server.messages[0][2])
+        # end for
+    # end test_dot_stuffing
+
+    def test_refused_recipients(self):
+        server, action = self.start(pipelining=True)
+        mixed = action.send(to=["bad@example.com", "good@example.com"], subject="Mixed", body="Body")
+        refused = action.send(to="bad@example.com", subject="Refused", body="Body")
+        after = action.send(to="next@example.com", subject="After", body="Body")
+        self.assertEqual(list(mixed.result(timeout=5)), ["bad@example.com"])
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            refused.result(timeout=5)
+        # end with
+        self.assertEqual(after.result(timeout=5), {})
+        self.assertEqual([recipients for _, recipients, _ in server.messages], [["good@example.com"], ["next@example.com"]])
+        self.assertEqual(action.stats()["retried"], 0)
+    # end test_refused_recipients
+
+    def test_flush_waits_for_retries(self):
+        server, action = self.start(temporary_failures=1, retry_delay=0.2)
+        future = action.send(to="later@example.com", subject="Later", body="Body")
+        self.assertTrue(action.flush(timeout=5))
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), {})
+        self.assertEqual(action.stats()["retried"], 1)
+    # end test_flush_waits_for_retries
+
+    def test_close_fails_waiting_retries(self):
+        server, action = self.start(temporary_failures=10, retry_delay=30)
+        future = action.send(to="later@example.com", subject="Later", body="Body")
+        deadline = time.monotonic() + 5
+        while action.stats()["retrying"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # end while
+        action.close(timeout=0.1)
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            future.result(timeout=1)
+        # end with
+    # end test_close_fails_waiting_retries
+
+# end EmailActionTest
+
+
+if __name__ == "__main__":
+    unittest.main()
+# end if
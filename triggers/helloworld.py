@@ -13,13 +13,11 @@
 #  (c) 2025 TaskFlowX Nils Schaetti <n.schaetti@gmail.com>
 
 # Imports
-import time
-import threading
-from taskflowx.triggers import Trigger
+from taskflowx.triggers import PollingTrigger
 
 
 # Hello world trigger
-class HelloWorldTrigger(Trigger):
+class HelloWorldTrigger(PollingTrigger):
     """
     Hello world trigger.
     """
@@ -35,9 +33,7 @@ class HelloWorldTrigger(Trigger):
         Args:
         - interval: The interval to trigger the callback.
         """
-        self.params = {
-            "interval": interval
-        }
+        super().__init__(interval=interval)
     # end __init__
 
     @staticmethod
@@ -49,22 +45,15 @@ class HelloWorldTrigger(Trigger):
     # end trigger_name
 
     # Pull the trigger
-    def start(self, callback):
+    def poll(self, callback):
         """
-        Start the schedule trigger.
+        Call the callback.
 
         Args:
         - callback: The callback function to call.
         """
-        def run():
-            while True:
-                callback()
-                time.sleep(self.params["interval"])
-            # end while
-        # end run
-
-        # Start the thread
-        threading.Thread(target=run, daemon=True).start()
-    # end start
+        callback()
+        return True
+    # end poll
 
 # end HelloWorldTrigger